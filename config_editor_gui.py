@@ -5,14 +5,27 @@ Provides a user-friendly interface to edit YAML configuration.
 """
 
 import tkinter as tk
-from tkinter import ttk, messagebox, filedialog
+from tkinter import ttk, messagebox, filedialog, scrolledtext
 import re
 from pathlib import Path
 from config_manager import ConfigManager, ValidationResult
 
+# Config values treated as checked for boolean fields
+_BOOL_TRUE = frozenset(('true', 'True', True, 1, '1'))
+
+
+def _is_checked(value) -> bool:
+    """Whether a config value shows as a ticked checkbox"""
+    # Only scalars are hashable; a list/dict would raise TypeError in the set lookup
+    return isinstance(value, (str, bool, int, float)) and value in _BOOL_TRUE
+
+
 class ConfigEditorGUI:
     """GUI Configuration Editor with tabbed interface."""
     
+    # Longer validation reports go to a scrollable window instead of a messagebox
+    MAX_MESSAGEBOX_ITEMS = 20
+    
     def __init__(self, root=None, config_manager=None):
         if root is None:
             self.root = tk.Tk()
@@ -25,9 +38,13 @@ class ConfigEditorGUI:
         self.field_widgets = {}
         self.validation_labels = {}
         self.unsaved_changes = False
+        self.dirty_fields = set()  # Fields edited since the config was last synced
+        self.loading_fields = False  # True while load_configuration fills in the widgets
+        self.pending_status_update = None
         
         self.setup_gui()
-        self.load_configuration()
+        # Let the window paint before (re)loading values into the fields
+        self.root.after_idle(self.load_configuration)
         
         if self.is_standalone:
             self.root.mainloop()
@@ -77,38 +94,99 @@ class ConfigEditorGUI:
     def create_tabs(self):
         """Create tabbed interface for different configuration categories."""
         categories = self.config.get_categories()
+        self.field_infos = self.config.get_all_field_infos()
         
+        # Tab frames are placeholders; a single canvas and scrollbar are packed
+        # into whichever tab is selected and the category frames are swapped in.
+        # Fields are only built the first time a tab is shown.
+        self.tab_content = {}
+        self.pending_tabs = {}
         for category_name, fields in categories.items():
-            # Create tab frame
             tab_frame = ttk.Frame(self.notebook)
             self.notebook.add(tab_frame, text=category_name)
-            
-            # Create scrollable frame
-            canvas = tk.Canvas(tab_frame)
-            scrollbar = ttk.Scrollbar(tab_frame, orient="vertical", command=canvas.yview)
-            scrollable_frame = ttk.Frame(canvas)
-            
-            scrollable_frame.bind(
-                "<Configure>",
-                lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-            )
-            
-            canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
-            canvas.configure(yscrollcommand=scrollbar.set)
-            
-            canvas.pack(side="left", fill="both", expand=True)
-            scrollbar.pack(side="right", fill="y")
-            
-            # Add fields to tab
-            self.create_fields(scrollable_frame, category_name, fields)
-            
-            # Bind mousewheel to canvas
-            def _on_mousewheel(event, canvas=canvas):
-                canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
-            canvas.bind_all("<MouseWheel>", _on_mousewheel)
+            self.pending_tabs[str(tab_frame)] = (category_name, fields)
+        
+        # Create shared scrollable canvas (after the tabs so it stacks above them)
+        self.canvas = tk.Canvas(self.notebook)
+        self.scrollbar = ttk.Scrollbar(self.notebook, orient="vertical", command=self.canvas.yview)
+        self.canvas.configure(yscrollcommand=self.scrollbar.set)
+        self.canvas_window = self.canvas.create_window((0, 0), anchor="nw")
+        
+        # Wheel events reach the canvas and its field widgets through a bind tag of
+        # their own, so the application-wide "all" bindings are left untouched
+        self.wheel_tag = f"ConfigEditorWheel{self.canvas}"
+        for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            self.canvas.bind_class(self.wheel_tag, sequence, self._on_mousewheel)
+        self._add_wheel_tag(self.canvas)
+        self.canvas.bind("<Destroy>", self._unbind_mousewheel)
+        
+        self.notebook.bind("<<NotebookTabChanged>>", self.on_tab_changed)
+        self.on_tab_changed()
+    
+    def on_tab_changed(self, event=None):
+        """Move the shared canvas into the selected tab and show its fields."""
+        tab = self.notebook.select()
+        if tab in self.pending_tabs:
+            self._materialize_tab(tab)
+        
+        scrollable_frame = self.tab_content.get(tab)
+        if scrollable_frame is None:
+            return
+        
+        self.canvas.pack(in_=tab, side="left", fill="both", expand=True)
+        self.scrollbar.pack(in_=tab, side="right", fill="y")
+        self.canvas.itemconfigure(self.canvas_window, window=scrollable_frame)
+        self.canvas.yview_moveto(0)
+        
+        # A frame shown before keeps its size and gets no new <Configure>, so refit
+        # the scroll region once the pending layout has run
+        self.canvas.after_idle(self._update_scrollregion)
+    
+    def _materialize_tab(self, tab):
+        """Build the field widgets for a tab that has not been shown yet."""
+        category_name, fields = self.pending_tabs.pop(tab)
+        
+        scrollable_frame = ttk.Frame(self.canvas)
+        scrollable_frame.bind("<Configure>", self._update_scrollregion)
+        
+        # Add fields to tab
+        self.create_fields(scrollable_frame, category_name, fields, self.field_infos)
+        self._add_wheel_tag(scrollable_frame)
+        self.tab_content[tab] = scrollable_frame
+    
+    def _update_scrollregion(self, event=None):
+        """Fit the canvas scroll region to the currently displayed frame."""
+        self.canvas.configure(scrollregion=self.canvas.bbox("all"))
+    
+    def _add_wheel_tag(self, widget):
+        """Give a widget and its children the canvas wheel bind tag."""
+        tags = widget.bindtags()
+        if self.wheel_tag not in tags:
+            # Just before "all", so class bindings (e.g. combobox value cycling) still run first
+            widget.bindtags(tags[:-1] + (self.wheel_tag, tags[-1]))
+        for child in widget.winfo_children():
+            self._add_wheel_tag(child)
+    
+    def _unbind_mousewheel(self, event=None):
+        """Drop the wheel bind tag's class bindings when the canvas is destroyed."""
+        for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            self.canvas.unbind_class(self.wheel_tag, sequence)
+    
+    def _on_mousewheel(self, event):
+        """Scroll the shared canvas when the wheel is used over it."""
+        if event.num == 4:
+            step = -1
+        elif event.num == 5:
+            step = 1
+        else:
+            step = int(-1 * (event.delta / 120))
+        self.canvas.yview_scroll(step, "units")
     
-    def create_fields(self, parent, category_name, fields):
+    def create_fields(self, parent, category_name, fields, field_infos=None):
         """Create input fields for a category."""
+        if field_infos is None:
+            field_infos = {}
+        
         row = 0
         
         # Category header
@@ -117,90 +195,110 @@ class ConfigEditorGUI:
         header_label.grid(row=row, column=0, columnspan=2, pady=(10, 20), sticky='w')
         row += 1
         
+        # Configure column weights
+        parent.columnconfigure(1, weight=1)
+        
         for field_name, field_path in fields.items():
-            field_info = self.config.get_field_info(field_path)
+            field_info = field_infos.get(field_path) or self.config.get_field_info(field_path)
             
             # Create label
-            label_text = field_info['description']
-            if field_info['is_required']:
-                label_text += " *"
-            
-            label = ttk.Label(parent, text=label_text)
+            label = ttk.Label(parent, text=field_info['label'])
             label.grid(row=row, column=0, sticky='w', padx=(20, 10), pady=5)
             
             # Create input widget based on field type
-            widget = self.create_input_widget(parent, field_path, field_info)
+            widget, getter, setter = self.create_input_widget(parent, field_path, field_info)
             widget.grid(row=row, column=1, sticky='ew', padx=(0, 20), pady=5)
             
-            # Configure column weights
-            parent.columnconfigure(1, weight=1)
-            
             # Store widget reference
-            self.field_widgets[field_path] = widget
-            
-            # Create validation label
-            validation_label = ttk.Label(parent, text="", foreground='red', font=('Arial', 8))
-            validation_label.grid(row=row+1, column=1, sticky='w', padx=(0, 20))
-            self.validation_labels[field_path] = validation_label
+            self.field_widgets[field_path] = (widget, getter, setter)
             
+            # Leave a row for the validation label, created when first needed
             row += 2
         
         # Add some padding at the bottom
         ttk.Label(parent, text="").grid(row=row, column=0, pady=20)
     
     def create_input_widget(self, parent, field_path, field_info):
-        """Create appropriate input widget based on field type."""
+        """Create appropriate input widget based on field type.
+        
+        Returns a (widget, getter, setter) tuple; the getter reads the widget's
+        value for the config and the setter displays a config value.
+        """
         field_type = field_info['field_type']
         value = field_info['value'] or ""
         allowed_values = field_info['allowed_values']
         
         if allowed_values:
             # Combobox for enum values
-            widget = ttk.Combobox(parent, values=allowed_values, state='readonly')
-            if value in allowed_values:
-                widget.set(value)
-            widget.bind('<<ComboboxSelected>>', lambda e: self.on_field_change())
+            var = tk.StringVar(value=value if value in allowed_values else "")
+            widget = ttk.Combobox(parent, values=allowed_values, state='readonly', textvariable=var)
+            getter, setter = self._string_var_accessors(var)
             
         elif field_type == 'boolean':
             # Checkbutton for boolean values
             var = tk.BooleanVar()
-            var.set(value in ['true', 'True', True, 1, '1'])
+            var.set(_is_checked(value))
             widget = ttk.Checkbutton(parent, variable=var)
-            # Store variable reference in a custom attribute
-            setattr(widget, '_var', var)
-            widget.bind('<Button-1>', lambda e: self.root.after(10, self.on_field_change))
+            getter = var.get
+            
+            def setter(v, var=var):
+                checked = _is_checked(v)
+                if var.get() != checked:
+                    var.set(checked)
             
         elif field_type in ['email', 'url', 'phone'] or 'text' in field_type:
             # Entry widget for text fields
-            widget = ttk.Entry(parent, width=40)
-            widget.insert(0, str(value))
-            widget.bind('<KeyRelease>', lambda e: self.on_field_change())
+            var = tk.StringVar(value=str(value))
+            widget = ttk.Entry(parent, width=40, textvariable=var)
+            getter, setter = self._string_var_accessors(var, strip=True)
             
         else:
             # Default to Entry
-            widget = ttk.Entry(parent, width=40)
-            widget.insert(0, str(value))
-            widget.bind('<KeyRelease>', lambda e: self.on_field_change())
+            var = tk.StringVar(value=str(value))
+            widget = ttk.Entry(parent, width=40, textvariable=var)
+            getter, setter = self._string_var_accessors(var, strip=True)
         
-        return widget
+        # Every way of changing the value (typing, paste, keyboard toggles) writes the
+        # variable, so that is where edits are noticed; load_configuration mutes this
+        var.trace_add('write', lambda *args, fp=field_path: self._on_var_write(fp))
+        
+        # Store variable reference in a custom attribute
+        setattr(widget, '_var', var)
+        
+        return widget, getter, setter
+    
+    def _string_var_accessors(self, var, strip=False):
+        """Build getter/setter closures for a widget backed by a StringVar."""
+        def getter():
+            return var.get().strip() if strip else var.get()
+        
+        def setter(value):
+            # Leave the widget alone when it already shows this value
+            text = str(value)
+            if var.get() != text:
+                var.set(text)
+        
+        return getter, setter
     
     def load_configuration(self):
         """Load configuration into GUI fields."""
         try:
             self.config.load_config()
             
-            for field_path, widget in self.field_widgets.items():
-                value = self.config.get(field_path, "")
-                
-                if isinstance(widget, ttk.Combobox):
-                    widget.set(str(value))
-                elif isinstance(widget, ttk.Checkbutton):
-                    getattr(widget, '_var').set(value in ['true', 'True', True, 1, '1'])
-                elif isinstance(widget, ttk.Entry):
-                    widget.delete(0, tk.END)
-                    widget.insert(0, str(value))
+            # Tabs not built yet take their initial values from the reloaded config
+            if self.pending_tabs:
+                self.field_infos = self.config.get_all_field_infos()
+            
+            config_get = self.config.get
+            self.loading_fields = True
+            try:
+                for field_path, (widget, getter, setter) in self.field_widgets.items():
+                    setter(config_get(field_path, ""))
+            finally:
+                self.loading_fields = False
             
             self.unsaved_changes = False
+            self.dirty_fields.clear()
             self.update_status("Configuration loaded", 'green')
             
         except Exception as e:
@@ -211,17 +309,7 @@ class ConfigEditorGUI:
         """Save configuration from GUI fields."""
         try:
             # Update configuration with field values
-            for field_path, widget in self.field_widgets.items():
-                if isinstance(widget, ttk.Combobox):
-                    value = widget.get()
-                elif isinstance(widget, ttk.Checkbutton):
-                    value = getattr(widget, '_var').get()
-                elif isinstance(widget, ttk.Entry):
-                    value = widget.get().strip()
-                else:
-                    continue
-                
-                self.config.set(field_path, value)
+            self._sync_widgets_to_config()
             
             # Validate before saving
             validation = self.config.validate()
@@ -247,21 +335,20 @@ class ConfigEditorGUI:
             messagebox.showerror("Error", f"Failed to save configuration: {e}")
             self.update_status("Error saving configuration", 'red')
     
+    def _sync_widgets_to_config(self):
+        """Push values of fields edited since the last sync into the configuration."""
+        config_set = self.config.set
+        field_widgets = self.field_widgets
+        for field_path in self.dirty_fields:
+            widget, getter, setter = field_widgets[field_path]
+            config_set(field_path, getter())
+        self.dirty_fields.clear()
+    
     def validate_config(self):
         """Validate current configuration."""
         try:
             # Update config with current field values (without saving)
-            for field_path, widget in self.field_widgets.items():
-                if isinstance(widget, ttk.Combobox):
-                    value = widget.get()
-                elif isinstance(widget, ttk.Checkbutton):
-                    value = getattr(widget, '_var').get()
-                elif isinstance(widget, ttk.Entry):
-                    value = widget.get().strip()
-                else:
-                    continue
-                
-                self.config.set(field_path, value)
+            self._sync_widgets_to_config()
             
             validation = self.config.validate()
             self.show_validation_errors(validation)
@@ -285,19 +372,57 @@ class ConfigEditorGUI:
         
         # Show errors
         all_messages = validation.errors + validation.warnings
+        for msg in all_messages:
+            for field_path in self.field_widgets:
+                if field_path in msg:
+                    self.get_validation_label(field_path).config(text=msg)
+        
         if all_messages:
-            message = "Validation Results:\n\n"
+            parts = ["Validation Results:", ""]
             if validation.errors:
-                message += "Errors:\n" + "\n".join(f"• {err}" for err in validation.errors)
+                parts.append("Errors:")
+                parts.extend(f"• {err}" for err in validation.errors)
             if validation.warnings:
                 if validation.errors:
-                    message += "\n\n"
-                message += "Warnings:\n" + "\n".join(f"• {warn}" for warn in validation.warnings)
+                    parts.append("")
+                parts.append("Warnings:")
+                parts.extend(f"• {warn}" for warn in validation.warnings)
+            message = "\n".join(parts)
             
-            messagebox.showinfo("Validation Results", message)
+            if len(all_messages) > self.MAX_MESSAGEBOX_ITEMS:
+                self.show_text_dialog("Validation Results", message)
+            else:
+                messagebox.showinfo("Validation Results", message)
         else:
             messagebox.showinfo("Validation", "✅ Configuration is valid!")
     
+    def show_text_dialog(self, title, message):
+        """Show a long message in a scrollable read-only window."""
+        dialog = tk.Toplevel(self.root)
+        dialog.title(title)
+        dialog.geometry("600x400")
+        dialog.transient(self.root.winfo_toplevel())
+        
+        text = scrolledtext.ScrolledText(dialog, wrap=tk.WORD)
+        text.insert('1.0', message)
+        text.config(state='disabled')
+        text.pack(fill='both', expand=True, padx=10, pady=(10, 5))
+        
+        ttk.Button(dialog, text="OK", command=dialog.destroy).pack(pady=(0, 10))
+        dialog.grab_set()
+    
+    def get_validation_label(self, field_path):
+        """Get the validation label below a field, creating it on first use."""
+        label = self.validation_labels.get(field_path)
+        if label is None:
+            widget = self.field_widgets[field_path][0]
+            row = int(widget.grid_info()['row']) + 1
+            label = ttk.Label(widget.master, text="", foreground='red', font=('Arial', 8))
+            label.grid(row=row, column=1, sticky='w', padx=(0, 20))
+            self._add_wheel_tag(label)
+            self.validation_labels[field_path] = label
+        return label
+    
     def reset_config(self):
         """Reset configuration to original values."""
         if self.unsaved_changes:
@@ -322,13 +447,31 @@ class ConfigEditorGUI:
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to load file: {e}")
     
-    def on_field_change(self):
-        """Handle field value changes."""
+    def _on_var_write(self, field_path):
+        """Record a user edit of a field's variable (values loaded from the config are ignored)."""
+        if not self.loading_fields:
+            self.on_field_change(field_path)
+    
+    def on_field_change(self, field_path=None):
+        """Handle field value changes, coalescing status updates from bursts of edits."""
         self.unsaved_changes = True
+        if field_path is not None:
+            self.dirty_fields.add(field_path)
+        if self.pending_status_update is not None:
+            self.root.after_cancel(self.pending_status_update)
+        self.pending_status_update = self.root.after(150, self._show_modified_status)
+    
+    def _show_modified_status(self):
+        """Show the modified status once edits have settled."""
+        self.pending_status_update = None
         self.update_status("Configuration modified (unsaved)", 'orange')
     
     def update_status(self, message, color='black'):
         """Update status label."""
+        if self.pending_status_update is not None:
+            # A newer status supersedes the pending "modified" message
+            self.root.after_cancel(self.pending_status_update)
+            self.pending_status_update = None
         self.status_label.config(text=message, foreground=color)
     
     def on_closing(self):
@@ -6,12 +6,168 @@ Handles YAML-based configuration with validation and variable substitution.
 
 import os
 import re
+import copy
+import json
+import threading
 import yaml
+from collections import OrderedDict
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any, List, Optional, Union
+from typing import Callable, Dict, Any, List, Optional, Union
 from datetime import datetime
 from dataclasses import dataclass
 
+# Prefer the libyaml C bindings when PyYAML was built with them
+try:
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+except ImportError:
+    from yaml import SafeLoader, SafeDumper
+
+# Patterns used during validation and template resolution
+_EMAIL_RE = re.compile(r'^[^@]+@[^@]+\.[^@]+$')
+_PHONE_RE = re.compile(r'^\+\d{10,15}$')
+_TEMPLATE_RE = re.compile(r'\{([^}]+)\}')
+_PLACEHOLDER_RE = re.compile(r'\{([^{}]+)\}')
+# 'Month DD' fiscal dates, accepting what strptime('%B %d') accepts
+_FISCAL_RE = re.compile(
+    r'(January|February|March|April|May|June|July|August|September|October|November|December)'
+    r'\s+([0-3]?\d)', re.IGNORECASE)
+# Address fields joined, in order, into COMPANY_ADDRESS
+_ADDRESS_KEYS = (
+    'organization.contact.address.street',
+    'organization.contact.address.area',
+    'organization.contact.address.city',
+    'organization.contact.address.postal_code',
+    'organization.contact.address.country'
+)
+# Days per month; strptime defaults to the non-leap year 1900, so February has 28
+_MONTH_DAYS = {
+    'january': 31, 'february': 28, 'march': 31, 'april': 30, 'may': 31, 'june': 30,
+    'july': 31, 'august': 31, 'september': 30, 'october': 31, 'november': 30, 'december': 31
+}
+
+# User-friendly GUI descriptions for fields that need more than their key name
+_FIELD_DESCRIPTIONS = {
+    'organization.profile.name': 'Company display name',
+    'organization.profile.legal_name': 'Full legal company name',
+    'organization.contact.digital.email': 'Primary contact email',
+    'organization.contact.phone.main': 'Main phone number with country code',
+    'organization.legal.jurisdiction': 'Legal jurisdiction (country/state)',
+    'organization.operations.business_hours.weekdays': 'Working hours (e.g., 9:00 AM - 5:00 PM)',
+    'organization.operations.business_hours.days': 'Working days (e.g., Monday to Friday)',
+}
+
+@lru_cache(maxsize=512)
+def _split_path(key_path: str) -> tuple:
+    """Split a dot-notation path once and reuse the tuple for later calls."""
+    return tuple(key_path.split('.'))
+
+@lru_cache(maxsize=256)
+def _infer_field_type(field_path: str) -> str:
+    """Infer the GUI field type from a field path; paths are fixed, so results are cached."""
+    lowered = field_path.lower()
+    if 'email' in lowered:
+        return 'email'
+    elif 'phone' in lowered:
+        return 'phone'
+    elif 'website' in lowered:
+        return 'url'
+    elif field_path.endswith('version_control'):
+        return 'boolean'
+    elif 'date' in lowered:
+        return 'date'
+    else:
+        return 'text'
+
+# Parsed YAML keyed by (path, mtime, size) so reloading an unchanged file skips parsing
+_PARSE_CACHE: "OrderedDict[tuple, Dict[str, Any]]" = OrderedDict()
+_PARSE_CACHE_MAX_ENTRIES = 100
+
+def _sidecar_path(path: Path) -> Path:
+    """Path of the JSON copy written next to a YAML configuration file."""
+    return path.with_name(path.name + '.json')
+
+def _remove_sidecar(sidecar: Path):
+    """Delete a sidecar file if present (Path.unlink(missing_ok=...) needs Python 3.8)."""
+    try:
+        sidecar.unlink()
+    except OSError:
+        pass
+
+def _has_only_str_keys(value: Any) -> bool:
+    """True if every mapping in a config tree has string keys (JSON would stringify others)."""
+    if isinstance(value, dict):
+        return all(isinstance(key, str) and _has_only_str_keys(item) for key, item in value.items())
+    if isinstance(value, list):
+        return all(_has_only_str_keys(item) for item in value)
+    return True
+
+def _write_json_sidecar(path: Path, data: Dict[str, Any]):
+    """Write a JSON copy of the configuration so later loads can skip YAML parsing."""
+    sidecar = _sidecar_path(path)
+    if not _has_only_str_keys(data):
+        # JSON would turn keys like 2024 or True into strings - keep YAML only
+        _remove_sidecar(sidecar)
+        return
+    try:
+        # Record exactly which YAML file this copy matches; any other version makes it stale
+        stat = path.stat()
+        with open(sidecar, 'w', encoding='utf-8') as f:
+            json.dump({'yaml_mtime_ns': stat.st_mtime_ns, 'yaml_size': stat.st_size, 'data': data},
+                      f, ensure_ascii=False)
+    except (TypeError, ValueError, OSError):
+        # Values JSON cannot represent (e.g. YAML dates) - fall back to YAML only
+        _remove_sidecar(sidecar)
+
+def _load_json_sidecar(path: Path, stat: os.stat_result) -> Optional[Dict[str, Any]]:
+    """Load the JSON sidecar if it was written for exactly this version of the YAML file."""
+    sidecar = _sidecar_path(path)
+    try:
+        with open(sidecar, 'r', encoding='utf-8') as f:
+            stored = json.load(f)
+    except (OSError, ValueError):
+        return None
+    
+    if (isinstance(stored, dict) and stored.get('yaml_mtime_ns') == stat.st_mtime_ns
+            and stored.get('yaml_size') == stat.st_size and isinstance(stored.get('data'), dict)):
+        return stored['data']
+    
+    # YAML was edited, restored or replaced since the last save; the sidecar is stale
+    _remove_sidecar(sidecar)
+    return None
+
+def _flatten(data: Dict[str, Any], prefix: str, flat: Dict[str, Any]):
+    """Index every nested value of a config tree under its dot-notation path."""
+    for key, value in data.items():
+        # Keys get() could never address (non-strings, embedded dots) are not indexed
+        if not isinstance(key, str) or '.' in key:
+            continue
+        path = prefix + key
+        flat[path] = value
+        if isinstance(value, dict):
+            _flatten(value, path + '.', flat)
+
+def _load_yaml_cached(path: Path) -> Dict[str, Any]:
+    """Parse a YAML file, reusing the previous result if the file is unchanged."""
+    stat = path.stat()
+    key = (str(path), stat.st_mtime_ns, stat.st_size)
+    
+    cached = _PARSE_CACHE.get(key)
+    if cached is None:
+        cached = _load_json_sidecar(path, stat)
+        if cached is None:
+            # Hand PyYAML the raw bytes; it detects and decodes UTF-8 itself
+            with open(path, 'rb') as f:
+                cached = yaml.load(f, Loader=SafeLoader) or {}
+        _PARSE_CACHE[key] = cached
+        if len(_PARSE_CACHE) > _PARSE_CACHE_MAX_ENTRIES:
+            _PARSE_CACHE.popitem(last=False)
+    else:
+        _PARSE_CACHE.move_to_end(key)
+    
+    # Callers mutate the returned data via set(), so never hand out the cached object
+    return copy.deepcopy(cached)
+
 @dataclass
 class ValidationResult:
     is_valid: bool
@@ -21,10 +177,60 @@ class ValidationResult:
 class ConfigManager:
     """Manages YAML-based configuration with validation and variable substitution."""
     
+    # Field paths grouped by GUI category; shared by every call to get_categories()
+    _CATEGORIES = {
+        "Company Profile": {
+            "name": "organization.profile.name",
+            "legal_name": "organization.profile.legal_name",
+            "short_name": "organization.profile.short_name",
+            "industry": "organization.profile.industry",
+            "size": "organization.profile.size"
+        },
+        "Contact Information": {
+            "email": "organization.contact.digital.email",
+            "website": "organization.contact.digital.website",
+            "main_phone": "organization.contact.phone.main",
+            "emergency_phone": "organization.contact.phone.emergency",
+            "street": "organization.contact.address.street",
+            "area": "organization.contact.address.area",
+            "city": "organization.contact.address.city",
+            "postal_code": "organization.contact.address.postal_code",
+            "country": "organization.contact.address.country"
+        },
+        "Legal & Compliance": {
+            "jurisdiction": "organization.legal.jurisdiction",
+            "governing_law": "organization.legal.governing_law",
+            "regulatory_body": "organization.legal.regulatory_body",
+            "registration_number": "organization.legal.registration_number",
+            "tax_id": "organization.legal.tax_id"
+        },
+        "Operations": {
+            "business_days": "organization.operations.business_hours.days",
+            "business_hours": "organization.operations.business_hours.weekdays",
+            "timezone": "organization.operations.business_hours.timezone",
+            "fiscal_start": "organization.operations.fiscal_year.start",
+            "fiscal_end": "organization.operations.fiscal_year.end",
+            "current_fiscal": "organization.operations.fiscal_year.current_year"
+        },
+        "Policy Settings": {
+            "classification": "organization.policies.classification",
+            "version_control": "organization.policies.version_control",
+            "review_cycle": "organization.policies.review_cycle",
+            "approval_authority": "organization.policies.approval_authority"
+        }
+    }
+    
     def __init__(self, config_dir: str = "config"):
         self.config_dir = Path(config_dir)
         self.config_file = self.config_dir / "company.yaml"
         self.config_data = {}
+        self._flat: Dict[str, Any] = {}  # dot-notation path -> value
+        self._variables_cache: Optional[Dict[str, str]] = None
+        self._substitutions: Dict[str, str] = {}  # placeholder name -> text, shared by apply_templates calls
+        self._validation_cache: Optional[Dict[str, Any]] = None
+        self._config_version = 0  # bumped on every load/set
+        self._validate_cache: tuple = (-1, None)  # (config version, ValidationResult)
+        self._saved_version = -1  # config version last written to / read from disk
         self.load_config()
     
     def load_config(self) -> bool:
@@ -34,8 +240,14 @@ class ConfigManager:
                 print(f"⚠️  Configuration file not found: {self.config_file}")
                 return False
                 
-            with open(self.config_file, 'r', encoding='utf-8') as f:
-                self.config_data = yaml.safe_load(f) or {}
+            self.config_data = _load_yaml_cached(self.config_file)
+            self._flat = {}
+            _flatten(self.config_data, '', self._flat)
+            self._variables_cache = None
+            self._substitutions = {}
+            self._validation_cache = None
+            self._config_version += 1
+            self._saved_version = self._config_version
                 
             print(f"Configuration loaded from {self.config_file}")
             return True
@@ -49,17 +261,22 @@ class ConfigManager:
     
     def save_config(self) -> bool:
         """Save configuration to YAML file."""
+        # Nothing changed since the last load or save - the file is already current
+        if self._config_version == self._saved_version and self.config_file.exists():
+            return True
+        
         try:
             # Ensure config directory exists
             self.config_dir.mkdir(exist_ok=True)
             
             # Update metadata
-            if 'metadata' not in self.config_data:
-                self.config_data['metadata'] = {}
-            self.config_data['metadata']['last_updated'] = datetime.now().isoformat()
+            self.set('metadata.last_updated', datetime.now().isoformat())
             
             with open(self.config_file, 'w', encoding='utf-8') as f:
-                yaml.dump(self.config_data, f, default_flow_style=False, indent=2, allow_unicode=True)
+                yaml.dump(self.config_data, f, Dumper=SafeDumper, default_flow_style=False, indent=2,
+                          allow_unicode=True, sort_keys=False)
+            _write_json_sidecar(self.config_file, self.config_data)
+            self._saved_version = self._config_version
                 
             print(f"Configuration saved to {self.config_file}")
             return True
@@ -70,31 +287,38 @@ class ConfigManager:
     
     def get(self, key_path: str, default: Any = None) -> Any:
         """Get configuration value using dot notation."""
-        keys = key_path.split('.')
-        value = self.config_data
-        
-        for key in keys:
-            if isinstance(value, dict) and key in value:
-                value = value[key]
-            else:
-                return default
-                
-        return value
+        return self._flat.get(key_path, default)
     
     def set(self, key_path: str, value: Any) -> bool:
         """Set configuration value using dot notation."""
         try:
-            keys = key_path.split('.')
+            keys = _split_path(key_path)
             data = self.config_data
+            flat = self._flat
             
             # Navigate to the parent dictionary
-            for key in keys[:-1]:
+            for i, key in enumerate(keys[:-1]):
                 if key not in data:
                     data[key] = {}
+                    flat['.'.join(keys[:i + 1])] = data[key]
                 data = data[key]
             
+            # Drop index entries under a subtree that is being replaced
+            if isinstance(flat.get(key_path), dict):
+                prefix = key_path + '.'
+                for path in [p for p in flat if p.startswith(prefix)]:
+                    del flat[path]
+            
             # Set the final value
             data[keys[-1]] = value
+            flat[key_path] = value
+            if isinstance(value, dict):
+                _flatten(value, key_path + '.', flat)
+            self._variables_cache = None
+            self._substitutions = {}
+            self._config_version += 1
+            if key_path == 'validation' or key_path.startswith('validation.'):
+                self._validation_cache = None
             return True
             
         except Exception as e:
@@ -103,30 +327,31 @@ class ConfigManager:
     
     def validate(self) -> ValidationResult:
         """Validate configuration against defined rules."""
+        # Nothing has been loaded or set since the last run - the result is unchanged
+        if self._validate_cache[0] == self._config_version:
+            return self._validate_cache[1]
+        
         errors = []
         warnings = []
         
-        validation_rules = self.get('validation', {})
-        required_fields = validation_rules.get('required_fields', [])
-        field_patterns = validation_rules.get('field_patterns', {})
-        field_types = validation_rules.get('field_types', {})
+        rules = self._prepare_validation()
         
         # Check required fields
-        for field_path in required_fields:
+        for field_path in rules['required_fields']:
             value = self.get(field_path)
             if value is None or value == "":
                 errors.append(f"Required field missing: {field_path}")
         
         # Check field patterns
-        for field_path, pattern in field_patterns.items():
+        for field_path, pattern in rules['field_patterns'].items():
             value = self.get(field_path)
-            if value and not re.match(pattern, str(value)):
+            if value and not pattern.match(str(value)):
                 errors.append(f"Invalid format for {field_path}: {value}")
         
         # Check field types (enum validation)
-        for field_path, allowed_values in field_types.items():
+        for field_path, (allowed_values, allowed_set) in rules['field_types'].items():
             value = self.get(field_path)
-            if value and value not in allowed_values:
+            if value and not self._is_allowed(value, allowed_values, allowed_set):
                 errors.append(f"Invalid value for {field_path}: {value}. Must be one of: {allowed_values}")
         
         # Additional validation checks
@@ -134,16 +359,57 @@ class ConfigManager:
         self._validate_dates(errors, warnings)
         
         is_valid = len(errors) == 0
-        return ValidationResult(is_valid, errors, warnings)
+        result = ValidationResult(is_valid, errors, warnings)
+        self._validate_cache = (self._config_version, result)
+        return result
+    
+    def _prepare_validation(self) -> Dict[str, Any]:
+        """Get the validation rules with patterns compiled, rebuilding only after they change."""
+        if self._validation_cache is not None:
+            return self._validation_cache
+        
+        validation_rules = self.get('validation', {})
+        field_types = {}
+        for field_path, allowed_values in validation_rules.get('field_types', {}).items():
+            # Only lists/tuples become sets; a string keeps its substring `in` check
+            allowed_set = None
+            if isinstance(allowed_values, (list, tuple)):
+                try:
+                    allowed_set = frozenset(allowed_values)
+                except TypeError:
+                    pass
+            field_types[field_path] = (allowed_values, allowed_set)
+        
+        required_fields = validation_rules.get('required_fields', [])
+        self._validation_cache = {
+            'required_fields': required_fields,
+            'required_set': frozenset(field for field in required_fields if isinstance(field, str)),
+            'field_patterns': {
+                field_path: re.compile(pattern)
+                for field_path, pattern in validation_rules.get('field_patterns', {}).items()
+            },
+            'field_types': field_types
+        }
+        return self._validation_cache
+    
+    @staticmethod
+    def _is_allowed(value: Any, allowed_values: List, allowed_set: Optional[frozenset]) -> bool:
+        """Check an enum value, using the precomputed set when the value is hashable."""
+        if allowed_set is not None:
+            try:
+                return value in allowed_set
+            except TypeError:
+                pass
+        return value in allowed_values
     
     def _validate_contact_info(self, errors: List[str], warnings: List[str]):
         """Validate contact information."""
         email = self.get('organization.contact.digital.email')
-        if email and not re.match(r'^[^@]+@[^@]+\.[^@]+$', email):
+        if email and not _EMAIL_RE.match(email):
             errors.append(f"Invalid email format: {email}")
             
         phone = self.get('organization.contact.phone.main')
-        if phone and not re.match(r'^\+\d{10,15}$', phone):
+        if phone and not _PHONE_RE.match(phone):
             warnings.append(f"Phone number format should include country code: {phone}")
     
     def _validate_dates(self, errors: List[str], warnings: List[str]):
@@ -153,14 +419,22 @@ class ConfigManager:
         
         if fiscal_start and fiscal_end:
             # Basic date format validation
-            try:
-                datetime.strptime(fiscal_start, '%B %d')
-                datetime.strptime(fiscal_end, '%B %d')
-            except ValueError:
+            if not (self._is_fiscal_date(fiscal_start) and self._is_fiscal_date(fiscal_end)):
                 errors.append("Invalid fiscal year date format. Use 'Month DD' format.")
     
+    @staticmethod
+    def _is_fiscal_date(value: str) -> bool:
+        """Check a 'Month DD' date without going through strptime."""
+        match = _FISCAL_RE.fullmatch(value)
+        if not match:
+            return False
+        return 1 <= int(match.group(2)) <= _MONTH_DAYS[match.group(1).lower()]
+    
     def get_variables_dict(self) -> Dict[str, str]:
         """Generate variables dictionary for backward compatibility."""
+        if self._variables_cache is not None:
+            return self._variables_cache
+        
         variables = {}
         
         # Basic organization info
@@ -175,14 +449,8 @@ class ConfigManager:
         variables['EMERGENCY_CONTACT'] = self.get('organization.contact.phone.emergency', variables['COMPANY_PHONE'])
         
         # Address (construct full address)
-        address_parts = [
-            self.get('organization.contact.address.street', ''),
-            self.get('organization.contact.address.area', ''),
-            self.get('organization.contact.address.city', ''),
-            self.get('organization.contact.address.postal_code', ''),
-            self.get('organization.contact.address.country', '')
-        ]
-        variables['COMPANY_ADDRESS'] = ', '.join(filter(None, address_parts))
+        flat_get = self._flat.get
+        variables['COMPANY_ADDRESS'] = ', '.join(part for part in map(flat_get, _ADDRESS_KEYS) if part)
         
         # Legal and operations
         variables['JURISDICTION'] = self.get('organization.legal.jurisdiction', '')
@@ -194,142 +462,107 @@ class ConfigManager:
         variables['SCOPE_EMPLOYEES'] = "All employees, contractors, and temporary staff"  # Default value
         
         # Remove empty variables
-        return {k: v for k, v in variables.items() if v}
+        self._variables_cache = {k: v for k, v in variables.items() if v}
+        return self._variables_cache
     
     def apply_templates(self, text: str) -> str:
         """Apply variable substitution using templates."""
-        if not text:
+        if not text or '{' not in text:
             return text
-            
-        # Get template definitions
-        templates = self.get('templates', {})
+        return self.get_substituter()(text)
+    
+    def get_substituter(self) -> Callable[[str], str]:
+        """Return a function applying variable substitution with the current configuration."""
+        # Get template definitions and direct variables
+        templates = self.get('templates', {}) or {}
+        variables = self.get_variables_dict()
+        # Resolved values stay valid until the next load/set, so later calls reuse them
+        resolved = self._substitutions
         
-        # Apply template substitutions
-        for template_name, template_value in templates.items():
-            placeholder = f"{{{template_name}}}"
-            if placeholder in text:
-                resolved_value = self.resolve_template(template_value)
-                text = text.replace(placeholder, resolved_value)
+        def substitute(match):
+            name = match.group(1)
+            if name not in resolved:
+                if name in templates:
+                    resolved[name] = self.resolve_template(templates[name])
+                elif name in variables:
+                    resolved[name] = str(variables[name])
+                else:
+                    # Leave unknown placeholders untouched
+                    resolved[name] = match.group(0)
+            return resolved[name]
         
-        # Apply direct variable substitutions
-        variables = self.get_variables_dict()
-        for var_name, var_value in variables.items():
-            placeholder = f"{{{var_name}}}"
-            if placeholder in text:
-                text = text.replace(placeholder, str(var_value))
+        def apply(text: str) -> str:
+            if not text or '{' not in text:
+                return text
+            # Templates take precedence over variables of the same name
+            return _PLACEHOLDER_RE.sub(substitute, text)
         
-        return text
+        return apply
     
     def resolve_template(self, template: str) -> str:
         """Resolve a template string with dot notation references."""
         if not template:
             return ""
+        if '{' not in template:
+            return template
             
-        # Find all {organization.path.to.value} patterns
-        pattern = r'\{([^}]+)\}'
-        matches = re.findall(pattern, template)
-        
-        result = template
-        for match in matches:
-            value = self.get(match, "")
-            result = result.replace(f"{{{match}}}", str(value))
-        
-        return result
+        # Replace every {organization.path.to.value} pattern in a single pass
+        flat_get = self._flat.get
+        return _TEMPLATE_RE.sub(lambda match: str(flat_get(match.group(1), "")), template)
     
     def get_categories(self) -> Dict[str, Dict]:
         """Get configuration organized by categories for GUI display."""
-        return {
-            "Company Profile": {
-                "name": "organization.profile.name",
-                "legal_name": "organization.profile.legal_name",
-                "short_name": "organization.profile.short_name",
-                "industry": "organization.profile.industry",
-                "size": "organization.profile.size"
-            },
-            "Contact Information": {
-                "email": "organization.contact.digital.email",
-                "website": "organization.contact.digital.website",
-                "main_phone": "organization.contact.phone.main",
-                "emergency_phone": "organization.contact.phone.emergency",
-                "street": "organization.contact.address.street",
-                "area": "organization.contact.address.area",
-                "city": "organization.contact.address.city",
-                "postal_code": "organization.contact.address.postal_code",
-                "country": "organization.contact.address.country"
-            },
-            "Legal & Compliance": {
-                "jurisdiction": "organization.legal.jurisdiction",
-                "governing_law": "organization.legal.governing_law",
-                "regulatory_body": "organization.legal.regulatory_body",
-                "registration_number": "organization.legal.registration_number",
-                "tax_id": "organization.legal.tax_id"
-            },
-            "Operations": {
-                "business_days": "organization.operations.business_hours.days",
-                "business_hours": "organization.operations.business_hours.weekdays",
-                "timezone": "organization.operations.business_hours.timezone",
-                "fiscal_start": "organization.operations.fiscal_year.start",
-                "fiscal_end": "organization.operations.fiscal_year.end",
-                "current_fiscal": "organization.operations.fiscal_year.current_year"
-            },
-            "Policy Settings": {
-                "classification": "organization.policies.classification",
-                "version_control": "organization.policies.version_control",
-                "review_cycle": "organization.policies.review_cycle",
-                "approval_authority": "organization.policies.approval_authority"
-            }
-        }
+        return self._CATEGORIES
     
     def get_field_info(self, field_path: str) -> Dict[str, Any]:
         """Get information about a specific field for GUI display."""
-        validation_rules = self.get('validation', {})
-        field_types = validation_rules.get('field_types', {})
-        required_fields = validation_rules.get('required_fields', [])
+        return self._build_field_info(field_path, self._prepare_validation())
+    
+    def get_all_field_infos(self) -> Dict[str, Dict[str, Any]]:
+        """Get field information for every categorized field in a single pass."""
+        rules = self._prepare_validation()
+        
+        field_infos = {}
+        for fields in self.get_categories().values():
+            for field_path in fields.values():
+                field_infos[field_path] = self._build_field_info(field_path, rules)
+        return field_infos
+    
+    def _build_field_info(self, field_path: str, rules: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the GUI info dictionary for a field from the prepared validation rules."""
+        is_required = field_path in rules['required_set']
+        allowed = rules['field_types'].get(field_path)
+        description = self._get_field_description(field_path)
         
         return {
             'value': self.get(field_path),
-            'is_required': field_path in required_fields,
-            'allowed_values': field_types.get(field_path),
+            'is_required': is_required,
+            'allowed_values': allowed[0] if allowed else None,
             'field_type': self._infer_field_type(field_path),
-            'description': self._get_field_description(field_path)
+            'description': description,
+            'label': description + " *" if is_required else description
         }
     
     def _infer_field_type(self, field_path: str) -> str:
         """Infer the GUI field type based on field path and value."""
-        if 'email' in field_path.lower():
-            return 'email'
-        elif 'phone' in field_path.lower():
-            return 'phone'
-        elif 'website' in field_path.lower():
-            return 'url'
-        elif field_path.endswith('version_control'):
-            return 'boolean'
-        elif 'date' in field_path.lower():
-            return 'date'
-        else:
-            return 'text'
+        return _infer_field_type(field_path)
     
     def _get_field_description(self, field_path: str) -> str:
         """Get user-friendly description for field."""
-        descriptions = {
-            'organization.profile.name': 'Company display name',
-            'organization.profile.legal_name': 'Full legal company name',
-            'organization.contact.digital.email': 'Primary contact email',
-            'organization.contact.phone.main': 'Main phone number with country code',
-            'organization.legal.jurisdiction': 'Legal jurisdiction (country/state)',
-            'organization.operations.business_hours.weekdays': 'Working hours (e.g., 9:00 AM - 5:00 PM)',
-            'organization.operations.business_hours.days': 'Working days (e.g., Monday to Friday)',
-        }
-        return descriptions.get(field_path, field_path.split('.')[-1].replace('_', ' ').title())
+        return _FIELD_DESCRIPTIONS.get(field_path, field_path.split('.')[-1].replace('_', ' ').title())
 
 # Singleton instance for global access
 _config_manager = None
+_config_manager_lock = threading.Lock()
 
 def get_config_manager() -> ConfigManager:
     """Get the global ConfigManager instance."""
     global _config_manager
     if _config_manager is None:
-        _config_manager = ConfigManager()
+        # Double-checked so racing first callers load the YAML only once
+        with _config_manager_lock:
+            if _config_manager is None:
+                _config_manager = ConfigManager()
     return _config_manager
 
 def main():
@@ -8,6 +8,13 @@ import os
 import json
 from datetime import datetime
 
+# orjson serializes the pretty-printed output in C; stdlib json is the fallback
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 def create_sample_organogram():
     """Create a sample organogram for demonstration."""
     organogram = {
@@ -40,8 +47,12 @@ def create_sample_organogram():
         }
     }
     
-    with open("demo_organogram.json", "w", encoding='utf-8') as f:
-        json.dump(organogram, f, indent=2, ensure_ascii=False)
+    if ORJSON_AVAILABLE:
+        with open("demo_organogram.json", "wb") as f:
+            f.write(orjson.dumps(organogram, option=orjson.OPT_INDENT_2))
+    else:
+        with open("demo_organogram.json", "w", encoding='utf-8') as f:
+            json.dump(organogram, f, indent=2, ensure_ascii=False)
     
     print("✅ Created demo_organogram.json")
     return "demo_organogram.json"
@@ -114,6 +125,17 @@ def show_system_status():
     print("\n📊 System Status")
     print("=" * 30)
     
+    # Read the directory once for both the file checks and the project listing
+    present, py_files, json_files = set(), [], []
+    with os.scandir('.') as entries:
+        for entry in entries:
+            name = entry.name
+            present.add(name)
+            if name.endswith('.py'):
+                py_files.append(name)
+            elif name.endswith('.json'):
+                json_files.append(name)
+    
     # Check for required files
     files_to_check = [
         ("gui_app.py", "GUI Application"),
@@ -125,7 +147,7 @@ def show_system_status():
     ]
     
     for filename, description in files_to_check:
-        if os.path.exists(filename):
+        if filename in present:
             print(f"✅ {description}")
         else:
             print(f"❌ {description} - Missing: {filename}")
@@ -147,8 +169,6 @@ def show_system_status():
     
     # Show project structure
     print(f"\n📁 Project Files")
-    py_files = [f for f in os.listdir('.') if f.endswith('.py')]
-    json_files = [f for f in os.listdir('.') if f.endswith('.json')]
     
     if py_files:
         print(f"   Python Scripts: {len(py_files)}")
@@ -17,17 +17,54 @@ Stage 3: Content Generation (this script)
 Stage 4: Document Generation (generate_documents.py)
 """
 
-import requests
+import argparse
+import hashlib
 import json
-import time
 import os
+import sqlite3
+import sys
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Dict, List, Optional
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 from config_manager import get_config_manager
+from lm_client import create_lm_session
+
+# orjson encodes/decodes in C; stdlib json is the fallback
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 
+def load_json(path: str):
+    """Read a JSON file, using orjson when it is installed"""
+    if ORJSON_AVAILABLE:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def dump_json(data, path: str):
+    """Write indented UTF-8 JSON to a file, using orjson when it is installed"""
+    if ORJSON_AVAILABLE:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+    else:
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
 
-@dataclass
+
+# Slotted instances (no per-object __dict__) where dataclasses support it (Python 3.10+)
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_SLOTS)
 class SectionInfo:
     """Data class to hold section information"""
     number: str
@@ -40,7 +77,17 @@ class SectionInfo:
     needs_revision: bool = False
 
     def to_dict(self):
-        return asdict(self)
+        # Field-by-field literal; cheaper than asdict()'s recursive copy
+        return {
+            'number': self.number,
+            'title': self.title,
+            'description': self.description,
+            'content': self.content,
+            'status': self.status,
+            'word_count': self.word_count,
+            'review_notes': self.review_notes,
+            'needs_revision': self.needs_revision
+        }
     
     @classmethod
     def from_dict(cls, data):
@@ -56,18 +103,98 @@ class SectionInfo:
         )
 
 
+class ContextWindow:
+    """Keeps the trailing words of previously generated sections for prompt context"""
+    
+    def __init__(self, max_words: int = 500):
+        self.max_words = max_words
+        self.words = deque(maxlen=max_words)
+        self.total_words = 0
+        self.text = ""  # full text, only kept while it still fits in the window
+    
+    def add(self, entry: str):
+        """Append a section's text without re-splitting everything written so far"""
+        words = entry.split()
+        self.words.extend(words)
+        self.total_words += len(words)
+        if self.total_words <= self.max_words:
+            self.text += entry
+    
+    def get(self) -> str:
+        """Context text: the whole history while short, otherwise its last max_words words"""
+        if self.total_words <= self.max_words:
+            return self.text
+        return ' '.join(self.words)
+
+
+class ResponseCache:
+    """Exact-match cache of LM Studio responses, stored in SQLite in the project directory"""
+    
+    def __init__(self, cache_file: str, ttl_days: int = 30):
+        self.cache_file = cache_file
+        self.ttl_seconds = ttl_days * 24 * 60 * 60
+        self._lock = threading.Lock()
+        self.db = None
+        try:
+            # Shared by the section worker threads; every access goes through the lock
+            self.db = sqlite3.connect(cache_file, check_same_thread=False)
+            self.db.execute("CREATE TABLE IF NOT EXISTS responses "
+                            "(key TEXT PRIMARY KEY, response TEXT, created REAL)")
+            self.db.commit()
+        except sqlite3.Error as e:
+            print(f"⚠️ Could not open response cache: {e}")
+            self.db = None
+    
+    @staticmethod
+    def make_key(prompt: str, model_name: str, temperature: float, max_tokens: int) -> str:
+        """Hash the request; whitespace is collapsed so reformatted prompts still match"""
+        normalized_prompt = ' '.join(prompt.split())
+        key_source = json.dumps([model_name, temperature, max_tokens, normalized_prompt])
+        return hashlib.blake2b(key_source.encode('utf-8'), digest_size=16).hexdigest()
+    
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached content for a key, or None if missing or expired"""
+        if self.db is None:
+            return None
+        try:
+            with self._lock:
+                row = self.db.execute("SELECT response FROM responses WHERE key = ? AND created >= ?",
+                                      (key, time.time() - self.ttl_seconds)).fetchone()
+        except sqlite3.Error as e:
+            print(f"⚠️ Could not read response cache: {e}")
+            return None
+        return row[0] if row else None
+    
+    def put(self, key: str, content: str):
+        """Store a response"""
+        if self.db is None:
+            return
+        try:
+            with self._lock:
+                self.db.execute("INSERT OR REPLACE INTO responses (key, response, created) VALUES (?, ?, ?)",
+                                (key, content, time.time()))
+                self.db.commit()
+        except sqlite3.Error as e:
+            print(f"⚠️ Could not save response cache: {e}")
+
+
 class LMStudioClient:
     """Client for connecting to LM Studio API"""
     
-    def __init__(self, base_url: str = "http://localhost:1234", model_name: str = "local-model"):
+    def __init__(self, base_url: str = "http://localhost:1234", model_name: str = "local-model",
+                 cache: Optional[ResponseCache] = None, max_concurrency: int = 1):
         self.base_url = base_url.rstrip('/')
         self.model_name = model_name
         self.api_url = f"{self.base_url}/v1/chat/completions"
+        self.cache = cache
+        # One pooled connection per concurrent request, so batches keep their connections alive
+        self.session = create_lm_session(max(8, max_concurrency))
         
     def test_connection(self) -> bool:
         """Test if the connection to LM Studio is working"""
+        import requests
         try:
-            response = requests.get(f"{self.base_url}/v1/models", timeout=10)
+            response = self.session.get(f"{self.base_url}/v1/models", timeout=10)
             return response.status_code == 200
         except requests.RequestException as e:
             print(f"Connection test failed: {e}")
@@ -75,32 +202,85 @@ class LMStudioClient:
     
     def generate_response(self, prompt: str, max_tokens: int = 2000, temperature: float = 0.7) -> Optional[str]:
         """Generate a response from LM Studio"""
+        cache_key = None
+        if self.cache:
+            cache_key = ResponseCache.make_key(prompt, self.model_name, temperature, max_tokens)
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                print("♻️ Using cached response")
+                return cached
+        
+        import requests
         payload = {
             "model": self.model_name,
             "messages": [{"role": "user", "content": prompt}],
             "temperature": temperature,
             "max_tokens": max_tokens,
-            "stream": False
+            "stream": True
         }
         
         try:
-            response = requests.post(self.api_url, json=payload, timeout=120)
-            response.raise_for_status()
-            result = response.json()
-            return result['choices'][0]['message']['content'].strip()
+            # Tokens are read as they arrive; the timeout applies between chunks, so a stalled
+            # generation fails instead of blocking, and the connection is closed on any exit
+            with self.session.post(self.api_url, json=payload, timeout=120, stream=True) as response:
+                response.raise_for_status()
+                content = self._read_stream(response).strip()
+            if cache_key and content:
+                self.cache.put(cache_key, content)
+            return content
         except requests.RequestException as e:
             print(f"API request failed: {e}")
             return None
-        except (KeyError, IndexError) as e:
+        except (KeyError, IndexError, ValueError) as e:
             print(f"Error parsing response: {e}")
             return None
+    
+    def generate_batch(self, prompts: List[str], max_tokens: int = 2000,
+                       temperature: float = 0.7) -> List[Optional[str]]:
+        """Generate responses for several independent prompts in parallel, in prompt order"""
+        if len(prompts) <= 1:
+            return [self.generate_response(prompt, max_tokens, temperature) for prompt in prompts]
+        
+        # Parallel requests over the pooled session fill LM Studio's concurrent prediction slots
+        with ThreadPoolExecutor(max_workers=len(prompts)) as executor:
+            return list(executor.map(lambda prompt: self.generate_response(prompt, max_tokens, temperature),
+                                     prompts))
+    
+    @staticmethod
+    def _read_stream(response) -> str:
+        """Collect the content deltas of a server-sent event stream"""
+        parts = []
+        body = []
+        streamed = False
+        for line in response.iter_lines():
+            if not line.startswith(b'data:'):
+                body.append(line)
+                continue
+            streamed = True
+            data = line[5:].strip()
+            if data == b'[DONE]':
+                # Keep reading to the end of the body so the connection can be reused
+                continue
+            # Usage and keep-alive chunks carry no choices, or a choice without a delta
+            choices = json.loads(data).get('choices')
+            if not choices or not choices[0].get('delta'):
+                continue
+            parts.append(choices[0]['delta'].get('content') or '')
+        if not streamed:
+            # The server ignored "stream": true and sent a plain completion body
+            return json.loads(b'\n'.join(body))['choices'][0]['message']['content']
+        return ''.join(parts)
 
 
 class ContentGenerator:
     """Main class for generating policy manual content"""
     
-    def __init__(self, project_dir: str):
+    # Sections journaled between full rewrites of sections.json during generation
+    CHECKPOINT_INTERVAL = 10
+    
+    def __init__(self, project_dir: str, use_cache: bool = True):
         self.project_dir = project_dir
+        self.use_cache = use_cache
         
         # Initialize configuration manager
         self.config_manager = get_config_manager()
@@ -111,6 +291,12 @@ class ContentGenerator:
         self.organogram_file = os.path.join(os.getcwd(), "organogram.json")
         self.sections_file = os.path.join(project_dir, "sections.json")
         self.status_file = os.path.join(project_dir, "status.json")
+        # Per-section files written as sections finish, folded into sections.json at checkpoints
+        self.journal_dir = os.path.join(project_dir, "sections")
+        # Number of the current sections.json checkpoint; journal entries are tagged with it
+        self.checkpoint_file = os.path.join(self.journal_dir, "checkpoint.json")
+        self.checkpoint = 0
+        self.cache_file = os.path.join(project_dir, "llm_cache.sqlite")
         
         # Stage 2 note files
         self.notes_dir = os.path.join(project_dir, "notes")
@@ -122,52 +308,58 @@ class ContentGenerator:
         self.variables = {}
         self.organogram = {}
         self.client: Optional[LMStudioClient] = None
+        self.max_concurrency = 1  # from config.json, set by load_project
+        self.statistics: Dict = {}  # summary computed by save_to_files
         
         # User notes content
         self.general_notes = ""
         self.manual_notes = ""
+        
+        # Prompt text shared by every section, built once per loaded project
+        self._stable_prefix: Optional[str] = None
     
     def load_project(self):
         """Load project configuration and data"""
         # Load common config (LM Studio settings)
-        with open(self.config_file, 'r', encoding='utf-8') as f:
-            self.config = json.load(f)
+        self.config = load_json(self.config_file)
         
         # Load project-specific data from status.json and merge into config
         if os.path.exists(self.status_file):
-            with open(self.status_file, 'r', encoding='utf-8') as f:
-                status_data = json.load(f)
-                # Merge project-specific fields into config for backward compatibility
-                self.config.update({
-                    'manual_description': status_data.get('manual_description', ''),
-                    'created_date': status_data.get('created_date', ''),
-                    'project_name': status_data.get('project_name', ''),
-                    'stage': status_data.get('stage', ''),
-                    'policy_type': status_data.get('policy_type', ''),
-                    'responsibilities': status_data.get('responsibilities', {})
-                })
+            status_data = load_json(self.status_file)
+            # Merge project-specific fields into config for backward compatibility
+            self.config.update({
+                'manual_description': status_data.get('manual_description', ''),
+                'created_date': status_data.get('created_date', ''),
+                'project_name': status_data.get('project_name', ''),
+                'stage': status_data.get('stage', ''),
+                'policy_type': status_data.get('policy_type', ''),
+                'responsibilities': status_data.get('responsibilities', {})
+            })
         
         # Load sections
-        with open(self.sections_file, 'r', encoding='utf-8') as f:
-            sections_data = json.load(f)
-            self.sections = [SectionInfo.from_dict(data) for data in sections_data]
+        sections_data = load_json(self.sections_file)
+        self.sections = [SectionInfo.from_dict(data) for data in sections_data]
+        self.load_section_journal()
         
         # Load variables from ConfigManager
         self.variables = self.config_manager.get_variables_dict()
         
         # Load organogram
         if os.path.exists(self.organogram_file):
-            with open(self.organogram_file, 'r', encoding='utf-8') as f:
-                self.organogram = json.load(f)
+            self.organogram = load_json(self.organogram_file)
         
-        # Initialize LM Studio client
+        # Initialize LM Studio client, reusing earlier responses for unchanged prompts
+        self.max_concurrency = max(1, int(self.config.get('max_concurrency', 1)))
         self.client = LMStudioClient(
             self.config.get('lm_studio_url', 'http://localhost:1234'),
-            self.config.get('model_name', 'local-model')
+            self.config.get('model_name', 'local-model'),
+            ResponseCache(self.cache_file) if self.use_cache and self.config.get('cache_enabled', True) else None,
+            self.max_concurrency
         )
         
         # Load user notes from Stage 2
         self.load_user_notes()
+        self._stable_prefix = None
     
     def load_user_notes(self):
         """Load user notes from Stage 2 expansion"""
@@ -175,11 +367,8 @@ class ContentGenerator:
         if os.path.exists(self.general_notes_file):
             try:
                 with open(self.general_notes_file, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                    # Filter out comments (lines starting with #)
-                    lines = content.split('\n')
-                    filtered_lines = [line for line in lines if not line.strip().startswith('#')]
-                    self.general_notes = '\n'.join(filtered_lines).strip()
+                    # Filter out comments (lines starting with #) while reading
+                    self.general_notes = ''.join(line for line in f if not line.strip().startswith('#')).strip()
                     
                 print(f"📝 Loaded general notes ({len(self.general_notes)} characters)")
             except Exception as e:
@@ -193,11 +382,8 @@ class ContentGenerator:
         if os.path.exists(self.manual_notes_file):
             try:
                 with open(self.manual_notes_file, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                    # Filter out comments (lines starting with #)
-                    lines = content.split('\n')
-                    filtered_lines = [line for line in lines if not line.strip().startswith('#')]
-                    self.manual_notes = '\n'.join(filtered_lines).strip()
+                    # Filter out comments (lines starting with #) while reading
+                    self.manual_notes = ''.join(line for line in f if not line.strip().startswith('#')).strip()
                     
                 print(f"📝 Loaded manual-specific notes ({len(self.manual_notes)} characters)")
             except Exception as e:
@@ -207,52 +393,99 @@ class ContentGenerator:
             print("📝 No manual-specific notes found")
             self.manual_notes = ""
     
+    def load_section_journal(self):
+        """Apply sections saved after the last full save (e.g. by an interrupted run)"""
+        self.checkpoint = 0
+        if not os.path.isdir(self.journal_dir):
+            return
+        
+        # Stage 1/2 delete the journal when they rewrite sections.json, so the checkpoint
+        # number restarts from 0 with it
+        try:
+            self.checkpoint = int(load_json(self.checkpoint_file))
+        except (OSError, ValueError, TypeError):
+            self.checkpoint = 0
+        
+        applied = 0
+        for entry in os.scandir(self.journal_dir):
+            name, ext = os.path.splitext(entry.name)
+            if ext != '.json' or not name.isdigit():
+                continue
+            index = int(name)
+            try:
+                data = load_json(entry.path)
+            except (OSError, ValueError) as e:
+                print(f"⚠️ Skipping unreadable section file {entry.name}: {e}")
+                continue
+            # Entries from an earlier checkpoint are already in sections.json. Checkpoint
+            # numbers are used instead of mtimes, which can tie on coarse-timestamp filesystems
+            if data.get('checkpoint') != self.checkpoint:
+                continue
+            # Only trust the entry if the section list still has the same section at that index,
+            # and take just the generated fields so title/description edits are kept
+            if index < len(self.sections) and self.sections[index].number == data.get('number'):
+                section = self.sections[index]
+                section.content = data.get('content', section.content)
+                section.status = data.get('status', section.status)
+                section.word_count = data.get('word_count', section.word_count)
+                applied += 1
+        
+        if applied:
+            print(f"📝 Recovered {applied} section(s) saved after the last full save")
+    
+    def save_section(self, section_index: int):
+        """Save a single section without rewriting sections.json"""
+        os.makedirs(self.journal_dir, exist_ok=True)
+        data = self.sections[section_index].to_dict()
+        data['checkpoint'] = self.checkpoint
+        dump_json(data, os.path.join(self.journal_dir, f"{section_index:04d}.json"))
+    
     def save_sections(self):
         """Save sections to file"""
         sections_data = [section.to_dict() for section in self.sections]
-        with open(self.sections_file, 'w', encoding='utf-8') as f:
-            json.dump(sections_data, f, indent=2, ensure_ascii=False)
+        # Write to a temporary file first so an interrupted save never truncates sections.json
+        temp_file = self.sections_file + '.tmp'
+        dump_json(sections_data, temp_file)
+        os.replace(temp_file, self.sections_file)
+        
+        # Everything journaled is now in sections.json. Moving to the next checkpoint
+        # retires the existing entries even if removing them below is interrupted
+        if os.path.isdir(self.journal_dir):
+            self.checkpoint += 1
+            temp_file = self.checkpoint_file + '.tmp'
+            dump_json(self.checkpoint, temp_file)
+            os.replace(temp_file, self.checkpoint_file)
+            for entry in os.scandir(self.journal_dir):
+                name, ext = os.path.splitext(entry.name)
+                if ext == '.json' and name.isdigit():
+                    os.remove(entry.path)
     
     def save_status(self, status: Dict):
         """Save current project status"""
         status['last_updated'] = datetime.now().isoformat()
-        with open(self.status_file, 'w', encoding='utf-8') as f:
-            json.dump(status, f, indent=2)
+        dump_json(status, self.status_file)
     
-    def generate_section_content(self, section_index: int, existing_content: str = "") -> str:
-        """Generate content for a specific section using description as guidance"""
-        if section_index >= len(self.sections):
-            return ""
-            
-        section = self.sections[section_index]
+    def _build_stable_prefix(self) -> str:
+        """Build the part of the prompt that is identical for every section"""
         manual_description = self.config.get('manual_description', '')
         
-        context_prompt = ""
-        if existing_content:
-            # Limit context to avoid token limits
-            context_words = existing_content.split()
-            if len(context_words) > 500:
-                context_prompt = f"\n\nPreviously written content (for context):\n{' '.join(context_words[-500:])}"
-            else:
-                context_prompt = f"\n\nPreviously written content (for context):\n{existing_content}"
-        
         # Prepare variables context
         variables_context = ""
         if self.variables:
-            variables_context = "\n\nAvailable variables (use these placeholders in your content):\n"
-            for var_name, var_value in self.variables.items():
-                placeholder = f"[{var_name}]"
-                variables_context += f"- {placeholder}: {var_value}\n"
-            variables_context += "\nUse these placeholders where appropriate in your content (e.g., [COMPANY_NAME], [COMPANY_EMAIL])."
+            variable_lines = ''.join(f"- [{var_name}]: {var_value}\n" for var_name, var_value in self.variables.items())
+            variables_context = ("\n\nAvailable variables (use these placeholders in your content):\n" + variable_lines +
+                                 "\nUse these placeholders where appropriate in your content (e.g., [COMPANY_NAME], [COMPANY_EMAIL]).")
         
         # Prepare organogram/responsibility context
         responsibility_context = ""
         responsibilities = self.config.get('responsibilities', {})
         if responsibilities:
-            responsibility_context = "\n\nKey roles and responsibilities for this policy:\n"
-            for role_type, role_info in responsibilities.items():
-                responsibility_context += f"- {role_info.get('title', role_type)}: {role_info.get('name', '[NAME]')} ({role_info.get('email', '[EMAIL]')})\n"
-            responsibility_context += "\nReference these roles when specifying responsibilities, approvals, or escalation procedures in your content."
+            role_lines = ''.join(
+                f"- {role_info.get('title', role_type)}: {role_info.get('name', '[NAME]')} ({role_info.get('email', '[EMAIL]')})\n"
+                for role_type, role_info in responsibilities.items()
+            )
+            responsibility_context = ("\n\nKey roles and responsibilities for this policy:\n" + role_lines +
+                                      "\nReference these roles when specifying responsibilities, approvals, or escalation procedures in your content.")
         
         # Prepare user notes context
         notes_context = ""
@@ -267,14 +500,8 @@ class ContentGenerator:
             
             notes_context += "\n\nIncorporate relevant information from these notes into your content where appropriate."
         
-        prompt = f"""
+        return f"""
         You are writing a comprehensive policy manual about: {manual_description}
-        
-        Please write detailed content for this section:
-        Section {section.number}: {section.title}
-        
-        Section Description (your guide for what to cover):
-        {section.description}
         {variables_context}
         {responsibility_context}
         {notes_context}
@@ -290,28 +517,47 @@ class ContentGenerator:
         - Include relevant examples or scenarios where appropriate
         - Use variable placeholders where appropriate (e.g., [COMPANY NAME], [EFFECTIVE DATE])
         - Reference appropriate roles for responsibilities and approvals when relevant
-        {context_prompt}
-        
-        Write only the section content, do not include the section number or title in your response.
-        Focus specifically on what is described in the section description above.
         """
+    
+    def build_section_prompt(self, section_index: int, existing_content: str = "") -> str:
+        """Build the generation prompt for a section"""
+        section = self.sections[section_index]
         
-        print(f"🔄 Generating content for Section {section.number}: {section.title}")
-        print(f"   📝 Using description: {section.description[:100]}...")
+        context_prompt = ""
+        if existing_content:
+            # Limit context to avoid token limits
+            context_words = existing_content.split()
+            if len(context_words) > 500:
+                context_prompt = f"\n\nPreviously written content (for context):\n{' '.join(context_words[-500:])}"
+            else:
+                context_prompt = f"\n\nPreviously written content (for context):\n{existing_content}"
         
-        if not self.client:
-            print("❌ Client not initialized!")
-            return ""
+        # Shared text goes first so LM Studio can reuse its cached prefix across sections
+        if self._stable_prefix is None:
+            self._stable_prefix = self._build_stable_prefix()
         
-        content = self.client.generate_response(prompt, max_tokens=1500, temperature=0.6)
+        return self._stable_prefix + f"""{context_prompt}
+        
+        Please write detailed content for this section:
+        Section {section.number}: {section.title}
         
+        Section Description (your guide for what to cover):
+        {section.description}
+        
+        Write only the section content, do not include the section number or title in your response.
+        Focus specifically on what is described in the section description above.
+        """
+    
+    def record_section_content(self, section_index: int, content: Optional[str]) -> str:
+        """Store generated content on a section and report the outcome"""
+        section = self.sections[section_index]
         if content:
             # Update section
-            self.sections[section_index].content = content
-            self.sections[section_index].status = 'generated'
-            self.sections[section_index].word_count = len(content.split())
+            section.content = content
+            section.status = 'generated'
+            section.word_count = len(content.split())
             
-            print(f"✅ Generated {len(content.split())} words for section {section.number}")
+            print(f"✅ Generated {section.word_count} words for section {section.number}")
         else:
             print(f"❌ Failed to generate content for section {section.number}")
         
@@ -321,41 +567,83 @@ class ContentGenerator:
         """Generate content for all sections starting from a specific index"""
         print(f"\n🔄 Starting content generation from section {resume_from + 1} of {len(self.sections)}...")
         
-        existing_content = ""
+        if not self.client:
+            print("❌ Client not initialized!")
+            return
+        
+        # Only the last 500 words of earlier sections are sent as context
+        context = ContextWindow(500)
         
         # Build existing content from completed sections
         for i in range(resume_from):
             if i < len(self.sections) and self.sections[i].content:
-                existing_content += f"\n\nSection {self.sections[i].number}: {self.sections[i].title}\n{self.sections[i].content}"
-        
-        for i in range(resume_from, len(self.sections)):
-            section_content = self.generate_section_content(i, existing_content)
+                context.add(f"\n\nSection {self.sections[i].number}: {self.sections[i].title}\n{self.sections[i].content}")
+        
+        # LM Studio can serve several predictions at once (its "Max Concurrent Predictions"),
+        # so sections are requested in batches; each batch sees the content written before it
+        batch_size = self.max_concurrency
+        unsaved_sections = 0
+        
+        for batch_start in range(resume_from, len(self.sections), batch_size):
+            batch = range(batch_start, min(batch_start + batch_size, len(self.sections)))
+            existing_content = context.get()
+            prompts = [self.build_section_prompt(i, existing_content) for i in batch]
+            for i in batch:
+                print(f"🔄 Generating content for Section {self.sections[i].number}: {self.sections[i].title}")
+                print(f"   📝 Using description: {self.sections[i].description[:100]}...")
+            
+            results = self.client.generate_batch(prompts, max_tokens=1500, temperature=0.6)
             
-            if section_content:
-                existing_content += f"\n\nSection {self.sections[i].number}: {self.sections[i].title}\n{section_content}"
+            for i, content in zip(batch, results):
+                section_content = self.record_section_content(i, content)
+                self.save_section(i)
+                unsaved_sections += 1
+                # Extend the context in section order
+                if section_content:
+                    context.add(f"\n\nSection {self.sections[i].number}: {self.sections[i].title}\n{section_content}")
             
-            # Save progress after each section
-            self.save_sections()
+            # Save progress after each batch; sections.json is rewritten only at checkpoints
+            if unsaved_sections >= self.CHECKPOINT_INTERVAL:
+                self.save_sections()
+                unsaved_sections = 0
             
             completed_count = sum(1 for s in self.sections if s.status == 'generated')
             self.save_status({
                 'phase': 'generating_content',
                 'total_sections': len(self.sections),
                 'completed_sections': completed_count,
-                'current_section': i,
+                'current_section': batch[-1],
                 'manual_description': self.config.get('manual_description', '')
             })
-            
-            # Small delay to avoid overwhelming the API
-            time.sleep(1)
         
+        self.save_sections()
         print("✅ Completed content generation for all sections")
     
     def save_to_files(self, base_filename: str):
         """Save the manual content to JSON format for Stage 4 processing"""
         # Save sections data to JSON with enhanced structure for document generation
         json_filename = f"{base_filename}_content.json"
-        sections_data = [section.to_dict() for section in self.sections]
+        
+        # Serialize sections and gather statistics in one pass
+        sections_data = []
+        total_words = 0
+        sections_needing_revision = 0
+        sections_with_content = 0
+        for section in self.sections:
+            sections_data.append(section.to_dict())
+            total_words += section.word_count
+            if section.needs_revision:
+                sections_needing_revision += 1
+            if section.content.strip():
+                sections_with_content += 1
+        
+        self.statistics = {
+            'total_sections': len(self.sections),
+            'total_words': total_words,
+            'sections_needing_revision': sections_needing_revision,
+            'sections_with_content': sections_with_content,
+            'content_generation_completed': datetime.now().isoformat()
+        }
         
         # Enhanced content data structure for Stage 4
         content_data = {
@@ -371,18 +659,11 @@ class ContentGenerator:
                 'manual_specific_notes': self.manual_notes
             },
             'responsibilities': self.config.get('responsibilities', {}),
-            'statistics': {
-                'total_sections': len(self.sections),
-                'total_words': sum(s.word_count for s in self.sections),
-                'sections_needing_revision': sum(1 for s in self.sections if s.needs_revision),
-                'sections_with_content': sum(1 for s in self.sections if s.content.strip()),
-                'content_generation_completed': datetime.now().isoformat()
-            },
+            'statistics': self.statistics,
             'ready_for_stage_4': True
         }
         
-        with open(json_filename, 'w', encoding='utf-8') as f:
-            json.dump(content_data, f, indent=2, ensure_ascii=False)
+        dump_json(content_data, json_filename)
         
         print(f"📁 Saved content to {json_filename}")
         print(f"✅ Stage 3 (Content Generation) output ready for Stage 4 (Document Generation)")
@@ -390,27 +671,40 @@ class ContentGenerator:
         return json_filename
 
 
-def list_available_projects(stage_filter: Optional[int] = None) -> List[str]:
-    """List available project directories, optionally filtered by stage"""
+def list_available_projects(stage_filter: Optional[int] = None,
+                            statuses: Optional[Dict[str, Dict]] = None) -> List[str]:
+    """List available project directories, optionally filtered by stage
+    
+    When a statuses dict is given, each status.json read for the stage check is kept in it
+    by project name, so callers don't have to read it again.
+    """
     projects = []
-    for item in os.listdir('.'):
-        if os.path.isdir(item) and item.endswith('_project'):
-            project_name = item.replace('_project', '')
-            status_file = os.path.join(item, 'status.json')
-            sections_file = os.path.join(item, 'sections.json')
+    with os.scandir('.') as entries:
+        for entry in entries:
+            if not (entry.name.endswith('_project') and entry.is_dir()):
+                continue
+            project_name = entry.name.replace('_project', '')
             
-            if os.path.exists(status_file) and os.path.exists(sections_file):
+            # One directory read instead of an exists() call per required file
+            try:
+                with os.scandir(entry.path) as project_entries:
+                    project_files = {project_entry.name for project_entry in project_entries}
+            except OSError:
+                continue
+            
+            if 'status.json' in project_files and 'sections.json' in project_files:
                 # Check stage if filter is specified
                 if stage_filter is not None:
                     try:
-                        with open(status_file, 'r') as f:
-                            status = json.load(f)
-                            project_stage = status.get('stage', 0)
-                            # For Stage 3, accept Stage 2 completed projects
-                            if stage_filter == 3 and project_stage not in [2, 3]:
-                                continue
-                            elif stage_filter != 3 and project_stage != stage_filter:
-                                continue
+                        status = load_json(os.path.join(entry.path, 'status.json'))
+                        if statuses is not None:
+                            statuses[project_name] = status
+                        project_stage = status.get('stage', 0)
+                        # For Stage 3, accept Stage 2 completed projects
+                        if stage_filter == 3 and project_stage not in [2, 3]:
+                            continue
+                        elif stage_filter != 3 and project_stage != stage_filter:
+                            continue
                     except:
                         continue
                 
@@ -421,24 +715,27 @@ def list_available_projects(stage_filter: Optional[int] = None) -> List[str]:
 
 def main():
     """Main function for Stage 3 - Content Generation"""
+    parser = argparse.ArgumentParser(description='Policy Manual Content Generation - Stage 3')
+    parser.add_argument('--no-cache', action='store_true', help='Ignore cached LM Studio responses')
+    args = parser.parse_args()
+    
     print("🚀 Stage 3: Policy Manual Content Generation")
     print("=" * 60)
     
-    # First check for projects ready for Stage 3 (completed Stage 2)
-    stage_3_projects = list_available_projects(stage_filter=3)
+    # First check for projects ready for Stage 3 (completed Stage 2); their status files are kept
+    statuses = {}
+    stage_3_projects = list_available_projects(stage_filter=3, statuses=statuses)
     
     if stage_3_projects:
         print("📁 Projects ready for Stage 3 (Content Generation):")
         for i, project in enumerate(stage_3_projects, 1):
-            project_dir = f"{project}_project"
             try:
-                with open(os.path.join(project_dir, 'status.json'), 'r') as f:
-                    status = json.load(f)
-                    description = status.get('manual_description', 'No description')
-                    stage = status.get('stage', 'Unknown')
-                    stage_name = status.get('stage_name', 'unknown')
-                    completed = status.get('completed_sections', 0)
-                    total = status.get('total_sections', 0)
+                status = statuses[project]
+                description = status.get('manual_description', 'No description')
+                stage = status.get('stage', 'Unknown')
+                stage_name = status.get('stage_name', 'unknown')
+                completed = status.get('completed_sections', 0)
+                total = status.get('total_sections', 0)
                 
                 print(f"   {i}. {project}")
                 print(f"      Description: {description}")
@@ -458,15 +755,13 @@ def main():
         
         print("📁 Available projects (may not be ready for Stage 3):")
         for i, project in enumerate(all_projects, 1):
-            project_dir = f"{project}_project"
             try:
-                with open(os.path.join(project_dir, 'status.json'), 'r') as f:
-                    status = json.load(f)
-                    description = status.get('manual_description', 'No description')
-                    stage = status.get('stage', 'Unknown')
-                    stage_name = status.get('stage_name', 'unknown')
-                    completed = status.get('completed_sections', 0)
-                    total = status.get('total_sections', 0)
+                status = load_json(os.path.join(f"{project}_project", 'status.json'))
+                description = status.get('manual_description', 'No description')
+                stage = status.get('stage', 'Unknown')
+                stage_name = status.get('stage_name', 'unknown')
+                completed = status.get('completed_sections', 0)
+                total = status.get('total_sections', 0)
                 
                 print(f"   {i}. {project}")
                 print(f"      Description: {description}")
@@ -498,7 +793,7 @@ def main():
     print(f"\n📂 Selected project: {selected_project}")
     
     # Initialize content generator
-    generator = ContentGenerator(project_dir)
+    generator = ContentGenerator(project_dir, use_cache=not args.no_cache)
     
     try:
         # Load project data
@@ -521,7 +816,9 @@ def main():
             resume = input("Resume from where you left off? (y/n): ").strip().lower()
             
             if resume == 'y':
-                start_from = completed_sections
+                # Sections finish out of order when generated concurrently - resume at the first gap
+                start_from = next((i for i, s in enumerate(generator.sections) if s.status != 'generated'),
+                                  len(generator.sections))
                 print(f"🔄 Resuming from section {start_from + 1}")
             else:
                 start_from = 0
@@ -554,7 +851,7 @@ def main():
         print(f"   - {json_file} (structured content for document generation)")
         
         # Show final statistics
-        total_words = sum(s.word_count for s in generator.sections)
+        total_words = generator.statistics['total_words']
         print(f"\n📊 Final Statistics:")
         print(f"   Total sections: {len(generator.sections)}")
         print(f"   Total words: {total_words:,}")
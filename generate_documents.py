@@ -6,6 +6,7 @@ Simple document generator for the GUI system.
 import json
 import os
 import argparse
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from config_manager import get_config_manager
 
@@ -16,6 +17,45 @@ except ImportError:
     DOCX_AVAILABLE = False
 
 
+def _render_one(content_file, output_dir):
+    """Build the .docx for one content file and return a status line"""
+    try:
+        # Each worker process loads its own configuration manager for variable substitution
+        substitute = get_config_manager().get_substituter()
+        
+        with open(content_file, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        
+        doc = Document()
+        title = data.get('manual_description', 'Policy Manual')
+        # Apply variable substitution to title
+        title = substitute(title)
+        doc.add_heading(title, 0)
+        doc.add_paragraph(f"Generated: {datetime.now().strftime('%B %d, %Y')}")
+        
+        sections = data.get('sections', {})
+        for key, section in sections.items():
+            if isinstance(section, dict) and 'content' in section:
+                section_title = section.get('title', key)
+                # Apply variable substitution to section title
+                section_title = substitute(section_title)
+                doc.add_heading(section_title, level=1)
+                
+                content = section.get('content', '')
+                if content:
+                    # Apply variable substitution to content
+                    content = substitute(content)
+                    doc.add_paragraph(content)
+        
+        base_name = content_file.replace('content_', '').replace('.json', '')
+        output_file = os.path.join(output_dir, f"{base_name}_manual.docx")
+        doc.save(output_file)
+        return f" Created: {os.path.basename(output_file)}"
+        
+    except Exception as e:
+        return f" Error: {e}"
+
+
 def main():
     parser = argparse.ArgumentParser(description='Generate documents')
     parser.add_argument('--output', type=str, help='Output directory')
@@ -27,9 +67,6 @@ def main():
         print(" python-docx required")
         return
     
-    # Initialize configuration manager for variable substitution
-    config_manager = get_config_manager()
-    
     output_dir = args.output if args.output else "generated_documents"
     os.makedirs(output_dir, exist_ok=True)
     
@@ -39,39 +76,16 @@ def main():
         print(" No content files found")
         return
     
-    for content_file in content_files:
-        try:
-            with open(content_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            
-            doc = Document()
-            title = data.get('manual_description', 'Policy Manual')
-            # Apply variable substitution to title
-            title = config_manager.apply_templates(title)
-            doc.add_heading(title, 0)
-            doc.add_paragraph(f"Generated: {datetime.now().strftime('%B %d, %Y')}")
-            
-            sections = data.get('sections', {})
-            for key, section in sections.items():
-                if isinstance(section, dict) and 'content' in section:
-                    section_title = section.get('title', key)
-                    # Apply variable substitution to section title
-                    section_title = config_manager.apply_templates(section_title)
-                    doc.add_heading(section_title, level=1)
-                    
-                    content = section.get('content', '')
-                    if content:
-                        # Apply variable substitution to content
-                        content = config_manager.apply_templates(content)
-                        doc.add_paragraph(content)
-            
-            base_name = content_file.replace('content_', '').replace('.json', '')
-            output_file = os.path.join(output_dir, f"{base_name}_manual.docx")
-            doc.save(output_file)
-            print(f" Created: {os.path.basename(output_file)}")
-            
-        except Exception as e:
-            print(f" Error: {e}")
+    if len(content_files) == 1:
+        results = [_render_one(content_files[0], output_dir)]
+    else:
+        # Files are independent and python-docx is CPU-bound, so render them in separate processes
+        workers = min(len(content_files), os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = executor.map(_render_one, content_files, [output_dir] * len(content_files))
+    
+    for result in results:
+        print(result)
     
     print(" Complete!")
 
@@ -24,14 +24,89 @@ import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, scrolledtext
 import os
 import json
+import queue
+import re
+import shutil
 import threading
 import subprocess
 import sys
+from collections import deque
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Any, Optional, List
 from config_editor_gui import ConfigEditorGUI
 
+# Stage 3 progress markers printed by generate_content.py
+_STAGE3_START_RE = re.compile(r'from section (\d+) of (\d+)')
+_STAGE3_SECTION_DONE = "✅ Generated "
+
+# orjson encodes/decodes in C; stdlib json is the fallback
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def load_json(path: str):
+    """Read a JSON file in one read, parsing with orjson when it is installed"""
+    with open(path, 'rb') as f:
+        data = f.read()
+    # json.loads accepts UTF-8 bytes too, so neither parser needs a text decoder
+    return orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
+
+
+def dump_json(data, path: str):
+    """Write indented UTF-8 JSON in one write, replacing the file atomically"""
+    if ORJSON_AVAILABLE:
+        encoded = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    else:
+        encoded = json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+    
+    # Write to a temp file first so an interrupted save never leaves a truncated file
+    temp_path = path + '.tmp'
+    try:
+        with open(temp_path, 'wb') as f:
+            f.write(encoded)
+        os.replace(temp_path, path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+
+def copy_file(source: str, destination: str):
+    """Copy a small file with one read and one write, replacing the destination atomically"""
+    with open(source, 'rb') as f:
+        data = f.read()
+    
+    temp_path = destination + '.tmp'
+    try:
+        with open(temp_path, 'wb') as f:
+            f.write(data)
+        # Keep the source's permission bits, as shutil.copy did
+        shutil.copymode(source, temp_path)
+        os.replace(temp_path, destination)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+
+@lru_cache(maxsize=8)
+def _load_organogram_version(path: str, mtime_ns: int, size: int) -> Dict:
+    """Parse one version of an organogram file (callers must not modify the result)"""
+    return load_json(path)
+
+
+def load_organogram(path: str) -> Dict:
+    """Load an organogram, reusing the parsed copy while the file is unchanged"""
+    # A stat is far cheaper than re-parsing; a changed mtime or size forces a fresh read
+    stat = os.stat(path)
+    return _load_organogram_version(path, stat.st_mtime_ns, stat.st_size)
+
+
 class PolicyManualGUI:
     """Main GUI application for policy manual generation system."""
     
@@ -70,6 +145,16 @@ class PolicyManualGUI:
         self.stage_status = [tk.StringVar(value="⏳ Not Started") for _ in range(4)]
         self.current_stage = tk.IntVar(value=0)
         
+        # Log lines for text widgets are queued and written in batches (see log_message)
+        self._log_buffer = deque()
+        self._log_flush_pending = False
+        
+        # Pending documents list refresh and the rows currently shown (see refresh_documents_list)
+        self._docs_refresh_job = None
+        self._docs_rows = None
+        self._docs_scan_key = None
+        self._docs_force_scan = False
+        
     def create_widgets(self):
         """Create the main GUI widgets."""
         # Main container
@@ -174,7 +259,16 @@ class PolicyManualGUI:
         config_frame = ttk.Frame(self.notebook)
         self.notebook.add(config_frame, text="⚙️ Configuration")
         self.create_config_widgets(config_frame)
+        self.config_tab = config_frame
+        
+        # The embedded config editor is built the first time its tab is shown
+        self.notebook.bind("<<NotebookTabChanged>>", self.on_tab_changed)
         
+    def on_tab_changed(self, event=None):
+        """Build tab contents that are created on first use."""
+        if self.notebook.select() == str(self.config_tab) and not self.config_editor_built:
+            self.build_config_editor()
+            
     def create_stage1_widgets(self, parent):
         """Create Stage 1: Project Initiation interface."""
         # Main content frame
@@ -424,6 +518,18 @@ This stage produces the actual policy content using AI assistance."""
             state=tk.DISABLED
         ).pack(side=tk.LEFT, padx=(10, 0))
         
+        # Generator output
+        log_frame = ttk.LabelFrame(content_frame, text="📝 Stage 3 Output")
+        log_frame.pack(fill=tk.BOTH, expand=True, pady=(0, 20))
+        
+        self.stage3_log = scrolledtext.ScrolledText(
+            log_frame,
+            height=8,
+            wrap=tk.WORD,
+            state=tk.DISABLED
+        )
+        self.stage3_log.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+        
         # Output preview
         preview_frame = ttk.LabelFrame(content_frame, text="👁️ Content Preview")
         preview_frame.pack(fill=tk.BOTH, expand=True)
@@ -469,7 +575,7 @@ This final stage produces polished documents ready for distribution."""
         output_frame = ttk.Frame(options_grid)
         output_frame.grid(row=0, column=1, sticky=tk.W + tk.E, padx=(10, 0), pady=5)
         
-        self.output_dir = tk.StringVar(value=os.path.join(os.getcwd(), "generated_documents"))
+        self.output_dir = tk.StringVar(value=os.path.join(self.project_dir, "generated_documents"))
         
         output_entry = ttk.Entry(output_frame, textvariable=self.output_dir, width=40)
         output_entry.pack(side=tk.LEFT, fill=tk.X, expand=True)
@@ -561,20 +667,11 @@ This final stage produces polished documents ready for distribution."""
         )
         desc_label.pack(pady=(0, 20))
         
-        # Configuration editor frame
-        config_frame = ttk.LabelFrame(main_frame, text="Configuration Editor")
-        config_frame.pack(fill=tk.BOTH, expand=True, pady=(0, 10))
-        
-        # Embed the configuration editor
-        try:
-            self.config_editor = ConfigEditorGUI(config_frame)
-        except Exception as e:
-            error_label = ttk.Label(
-                config_frame,
-                text=f"Error loading configuration editor: {e}",
-                foreground='red'
-            )
-            error_label.pack(pady=20)
+        # Configuration editor frame; the editor loads and lays out the whole YAML config,
+        # so it is only embedded when the tab is first opened (see on_tab_changed)
+        self.config_editor_frame = ttk.LabelFrame(main_frame, text="Configuration Editor")
+        self.config_editor_frame.pack(fill=tk.BOTH, expand=True, pady=(0, 10))
+        self.config_editor_built = False
         
         # Quick actions frame
         actions_frame = ttk.LabelFrame(main_frame, text="Quick Actions")
@@ -612,6 +709,19 @@ This final stage produces polished documents ready for distribution."""
             width=25
         ).grid(row=1, column=1, padx=5, pady=5)
     
+    def build_config_editor(self):
+        """Embed the configuration editor in the Configuration tab."""
+        self.config_editor_built = True
+        try:
+            self.config_editor = ConfigEditorGUI(self.config_editor_frame)
+        except Exception as e:
+            error_label = ttk.Label(
+                self.config_editor_frame,
+                text=f"Error loading configuration editor: {e}",
+                foreground='red'
+            )
+            error_label.pack(pady=20)
+    
     def open_config_editor_standalone(self):
         """Open the configuration editor in a separate window."""
         try:
@@ -623,24 +733,32 @@ This final stage produces polished documents ready for distribution."""
     
     def validate_configuration(self):
         """Validate the current configuration."""
-        try:
-            from config_manager import get_config_manager
-            config_manager = get_config_manager()
-            validation = config_manager.validate()
-            
-            if validation.is_valid:
-                if validation.warnings:
-                    message = f"Configuration is valid!\n\nWarnings:\n" + "\n".join(validation.warnings)
-                    messagebox.showwarning("Validation Result", message)
-                else:
-                    messagebox.showinfo("Validation Result", "✅ Configuration is valid!")
-            else:
-                message = f"Configuration has errors:\n\n" + "\n".join(validation.errors)
-                messagebox.showerror("Validation Result", message)
+        # Load and validate in background thread; results are shown on the Tk thread
+        def validate_thread():
+            try:
+                from config_manager import get_config_manager
+                config_manager = get_config_manager()
+                validation = config_manager.validate()
+                self.root.after(0, lambda: self.on_validation_complete(validation))
+            except Exception as e:
+                self.root.after(0, lambda msg=str(e):
+                                messagebox.showerror("Error", f"Failed to validate configuration: {msg}"))
                 
-            self.log_message("Configuration validation completed")
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to validate configuration: {e}")
+        threading.Thread(target=validate_thread, daemon=True).start()
+        
+    def on_validation_complete(self, validation):
+        """Show the configuration validation result."""
+        if validation.is_valid:
+            if validation.warnings:
+                message = f"Configuration is valid!\n\nWarnings:\n" + "\n".join(validation.warnings)
+                messagebox.showwarning("Validation Result", message)
+            else:
+                messagebox.showinfo("Validation Result", "✅ Configuration is valid!")
+        else:
+            message = f"Configuration has errors:\n\n" + "\n".join(validation.errors)
+            messagebox.showerror("Validation Result", message)
+            
+        self.log_message("Configuration validation completed")
     
     def export_configuration(self):
         """Export configuration to a file."""
@@ -652,8 +770,7 @@ This final stage produces polished documents ready for distribution."""
             )
             
             if file_path:
-                import shutil
-                shutil.copy("config/company.yaml", file_path)
+                copy_file("config/company.yaml", file_path)
                 messagebox.showinfo("Export Complete", f"Configuration exported to:\n{file_path}")
                 self.log_message(f"Configuration exported to {os.path.basename(file_path)}")
         except Exception as e:
@@ -674,8 +791,8 @@ This final stage produces polished documents ready for distribution."""
                 )
                 
                 if result:
-                    import shutil
-                    shutil.copy(file_path, "config/company.yaml")
+                    # Atomic replace: a failed import leaves the current configuration intact
+                    copy_file(file_path, "config/company.yaml")
                     messagebox.showinfo("Import Complete", "Configuration imported successfully!")
                     self.log_message(f"Configuration imported from {os.path.basename(file_path)}")
                     
@@ -707,22 +824,22 @@ This final stage produces polished documents ready for distribution."""
         
     def update_time(self):
         """Update the time display."""
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        self.time_label.config(text=current_time)
-        self.root.after(1000, self.update_time)
+        now = datetime.now()
+        self.time_label.config(text=now.strftime("%Y-%m-%d %H:%M"))
+        # Minute resolution: wake up once, just after the next minute starts
+        self.root.after((60 - now.second) * 1000 - now.microsecond // 1000 + 50, self.update_time)
         
     def load_project_state(self):
         """Load the current project state from config.json."""
         try:
-            if os.path.exists(self.config_file):
-                with open(self.config_file, 'r', encoding='utf-8') as f:
-                    config = json.load(f)
-                    
-                self.project_state.update(config)
-                self.update_progress_display()
-                self.log_message("Project state loaded successfully")
-            else:
-                self.log_message("No existing project found - starting fresh")
+            # Open directly rather than checking exists() first - one less stat per launch
+            config = load_json(self.config_file)
+                
+            self.project_state.update(config)
+            self.update_progress_display()
+            self.log_message("Project state loaded successfully")
+        except FileNotFoundError:
+            self.log_message("No existing project found - starting fresh")
         except Exception as e:
             self.log_message(f"Error loading project state: {str(e)}")
             
@@ -746,19 +863,34 @@ This final stage produces polished documents ready for distribution."""
         self.progress_text.config(text=f"{progress:.0f}% Complete")
         
     def log_message(self, message, widget=None):
-        """Log a message to the specified widget or status bar."""
+        """Log a message to the specified widget or status bar (Tk thread only)."""
         timestamp = datetime.now().strftime("%H:%M:%S")
         formatted_message = f"[{timestamp}] {message}"
         
         if widget:
-            widget.config(state=tk.NORMAL)
-            widget.insert(tk.END, formatted_message + "\n")
-            widget.see(tk.END)
-            widget.config(state=tk.DISABLED)
+            # Inserting and scrolling per line is slow for chatty stages; flush at most every 100 ms
+            self._log_buffer.append((widget, formatted_message))
+            if not self._log_flush_pending:
+                self._log_flush_pending = True
+                self.root.after(100, self._flush_log_buffer)
         
         self.status_text.config(text=message)
         print(formatted_message)  # Also log to console
         
+    def _flush_log_buffer(self):
+        """Write queued log lines to their widgets, one insert per widget."""
+        self._log_flush_pending = False
+        lines_by_widget = {}
+        while self._log_buffer:
+            widget, line = self._log_buffer.popleft()
+            lines_by_widget.setdefault(widget, []).append(line)
+            
+        for widget, lines in lines_by_widget.items():
+            widget.config(state=tk.NORMAL)
+            widget.insert(tk.END, "\n".join(lines) + "\n")
+            widget.see(tk.END)
+            widget.config(state=tk.DISABLED)
+        
     # Stage 1 Methods
     def browse_organogram_file(self):
         """Browse for organogram JSON file."""
@@ -781,8 +913,7 @@ This final stage produces polished documents ready for distribution."""
             return
             
         try:
-            with open(organogram_path, 'r', encoding='utf-8') as f:
-                organogram = json.load(f)
+            organogram = load_organogram(organogram_path)
             
             # Clear existing checkboxes
             for widget in self.manual_checkbox_frame.winfo_children():
@@ -840,17 +971,17 @@ This final stage produces polished documents ready for distribution."""
         # Disable UI during processing
         self.notebook.tab(0, state='disabled')
         
+        # Logging and Tk variable reads stay on the Tk thread; the worker only
+        # reaches the GUI through root.after
+        self.log_message("Starting Stage 1: Project Initiation...", self.stage1_log)
+        cmd = [
+            sys.executable, "init_project.py",
+            "--organogram", self.organogram_file.get(),
+            "--manuals"] + selected_manuals
+        
         # Run Stage 1 in background thread
         def run_stage1_thread():
             try:
-                self.log_message("Starting Stage 1: Project Initiation...", self.stage1_log)
-                
-                # Prepare command
-                cmd = [
-                    sys.executable, "init_project.py",
-                    "--organogram", self.organogram_file.get(),
-                    "--manuals"] + selected_manuals
-                
                 # Run the command
                 process = subprocess.Popen(
                     cmd,
@@ -878,7 +1009,7 @@ This final stage produces polished documents ready for distribution."""
                     self.root.after(0, lambda: self.on_stage1_error("Stage 1 failed with errors"))
                     
             except Exception as e:
-                self.root.after(0, lambda: self.on_stage1_error(str(e)))
+                self.root.after(0, lambda msg=str(e): self.on_stage1_error(msg))
                 
         threading.Thread(target=run_stage1_thread, daemon=True).start()
         
@@ -930,18 +1061,21 @@ This final stage produces polished documents ready for distribution."""
         try:
             sections_file = f"sections_{manual_name}.json"
             if os.path.exists(sections_file):
-                with open(sections_file, 'r', encoding='utf-8') as f:
-                    self.current_sections = json.load(f)
+                self.current_sections = load_json(sections_file)
                 
                 # Populate sections list
                 self.sections_listbox.delete(0, tk.END)
                 self.section_keys = []
+                display_names = []
                 
                 for section_key, section_data in self.current_sections.items():
                     if isinstance(section_data, dict) and 'title' in section_data:
-                        display_name = f"{section_key}: {section_data['title']}"
-                        self.sections_listbox.insert(tk.END, display_name)
+                        display_names.append(f"{section_key}: {section_data['title']}")
                         self.section_keys.append(section_key)
+                
+                # One Tcl call for all rows instead of one per section
+                if display_names:
+                    self.sections_listbox.insert(tk.END, *display_names)
                         
         except Exception as e:
             messagebox.showerror("Error", f"Failed to load sections: {str(e)}")
@@ -985,8 +1119,7 @@ This final stage produces polished documents ready for distribution."""
             manual_name = self.stage2_manual_combo.get()
             sections_file = f"sections_{manual_name}.json"
             
-            with open(sections_file, 'w', encoding='utf-8') as f:
-                json.dump(self.current_sections, f, indent=2, ensure_ascii=False)
+            dump_json(self.current_sections, sections_file)
                 
             self.log_message(f"Saved changes to section: {self.current_section_key}")
             messagebox.showinfo("Success", "Section changes saved successfully!")
@@ -998,30 +1131,47 @@ This final stage produces polished documents ready for distribution."""
             
     def run_stage2(self):
         """Execute Stage 2: Project Expansion."""
-        try:
-            self.log_message("Starting Stage 2: Project Expansion...")
-            
-            # Run project_expansion.py
-            cmd = [sys.executable, "project_expansion.py"]
-            result = subprocess.run(cmd, capture_output=True, text=True, cwd=self.project_dir)
-            
-            if result.returncode == 0:
-                self.project_state['stage'] = 2
-                if 2 not in self.project_state['stages_completed']:
-                    self.project_state['stages_completed'].append(2)
-                    
-                self.update_progress_display()
-                self.populate_stage3_manuals()
-                self.notebook.select(2)  # Switch to Stage 3 tab
+        self.log_message("Starting Stage 2: Project Expansion...")
+        
+        # Disable UI during processing
+        self.notebook.tab(1, state='disabled')
+        
+        # Run Stage 2 in background thread so the window keeps responding
+        def run_stage2_thread():
+            try:
+                # Run project_expansion.py
+                cmd = [sys.executable, "project_expansion.py"]
+                result = subprocess.run(cmd, capture_output=True, text=True, cwd=self.project_dir)
                 
-                messagebox.showinfo("Success", "Stage 2: Project Expansion completed successfully!")
-                self.log_message("✅ Stage 2 completed successfully!")
-            else:
-                raise Exception(result.stderr or "Stage 2 failed")
+                if result.returncode == 0:
+                    self.root.after(0, self.on_stage2_complete)
+                else:
+                    self.root.after(0, lambda msg=result.stderr or "Stage 2 failed": self.on_stage2_error(msg))
+                    
+            except Exception as e:
+                self.root.after(0, lambda msg=str(e): self.on_stage2_error(msg))
                 
-        except Exception as e:
-            messagebox.showerror("Error", f"Stage 2 failed: {str(e)}")
-            self.log_message(f"❌ Stage 2 failed: {str(e)}")
+        threading.Thread(target=run_stage2_thread, daemon=True).start()
+        
+    def on_stage2_complete(self):
+        """Handle Stage 2 completion."""
+        self.project_state['stage'] = 2
+        if 2 not in self.project_state['stages_completed']:
+            self.project_state['stages_completed'].append(2)
+            
+        self.update_progress_display()
+        self.populate_stage3_manuals()
+        self.notebook.tab(1, state='normal')
+        self.notebook.select(2)  # Switch to Stage 3 tab
+        
+        messagebox.showinfo("Success", "Stage 2: Project Expansion completed successfully!")
+        self.log_message("✅ Stage 2 completed successfully!")
+        
+    def on_stage2_error(self, error_msg):
+        """Handle Stage 2 error."""
+        self.notebook.tab(1, state='normal')
+        messagebox.showerror("Error", f"Stage 2 failed: {error_msg}")
+        self.log_message(f"❌ Stage 2 failed: {error_msg}")
             
     # Stage 3 Methods
     def populate_stage3_manuals(self):
@@ -1033,38 +1183,77 @@ This final stage produces polished documents ready for distribution."""
         """Execute Stage 3: Content Generation."""
         self.log_message("Starting Stage 3: Content Generation...")
         self.generation_status.config(text="Generating content...")
+        self.stage3_sections_done = 0
+        self.stage3_sections_total = 0
+        
+        # The worker thread reads the output; the Tk thread drains it in batches
+        output_queue = queue.Queue()
         
         def run_stage3_thread():
             try:
                 cmd = [sys.executable, "generate_content.py"]
+                # Unbuffered child output so progress lines arrive as they are printed
+                env = dict(os.environ, PYTHONUNBUFFERED='1')
                 process = subprocess.Popen(
                     cmd,
                     stdout=subprocess.PIPE,
                     stderr=subprocess.STDOUT,
                     text=True,
-                    cwd=self.project_dir
+                    bufsize=1,
+                    cwd=self.project_dir,
+                    env=env
                 )
                 
-                # Update progress periodically
-                progress = 0
-                while process.poll() is None:
-                    progress = min(progress + 10, 90)
-                    self.root.after(0, lambda p=progress: self.generation_progress.config(value=p))
-                    self.root.after(0, lambda: self.generation_status.config(text=f"Generating content... {progress}%"))
-                    try:
-                        process.wait(timeout=2)
-                    except subprocess.TimeoutExpired:
-                        continue
+                # Reading continuously also keeps the child from blocking on a full pipe
+                for line in process.stdout:
+                    output_queue.put(('line', line.rstrip('\n')))
+                output_queue.put(('done', process.wait()))
                 
-                if process.returncode == 0:
-                    self.root.after(0, self.on_stage3_complete)
-                else:
-                    self.root.after(0, lambda: self.on_stage3_error("Content generation failed"))
-                    
             except Exception as e:
-                self.root.after(0, lambda: self.on_stage3_error(str(e)))
+                output_queue.put(('error', str(e)))
                 
         threading.Thread(target=run_stage3_thread, daemon=True).start()
+        self.root.after(50, lambda: self.drain_stage3_output(output_queue))
+        
+    def drain_stage3_output(self, output_queue):
+        """Show Stage 3 output queued by the worker thread and track section progress."""
+        for _ in range(200):
+            try:
+                kind, value = output_queue.get_nowait()
+            except queue.Empty:
+                break
+                
+            if kind == 'line':
+                self.update_stage3_progress(value)
+                if value.strip():
+                    self.log_message(value, self.stage3_log)
+            elif kind == 'done':
+                if value == 0:
+                    self.on_stage3_complete()
+                else:
+                    self.on_stage3_error("Content generation failed")
+                return
+            else:
+                self.on_stage3_error(value)
+                return
+                
+        self.root.after(50, lambda: self.drain_stage3_output(output_queue))
+        
+    def update_stage3_progress(self, line):
+        """Advance the Stage 3 progress bar from a line of generate_content.py output."""
+        match = _STAGE3_START_RE.search(line)
+        if match:
+            self.stage3_sections_done = int(match.group(1)) - 1
+            self.stage3_sections_total = int(match.group(2))
+        elif line.startswith(_STAGE3_SECTION_DONE):
+            self.stage3_sections_done += 1
+        else:
+            return
+            
+        if self.stage3_sections_total:
+            progress = min(99, self.stage3_sections_done * 100 // self.stage3_sections_total)
+            self.generation_progress.config(value=progress)
+            self.generation_status.config(text=f"Generating content... {progress}%")
         
     def on_stage3_complete(self):
         """Handle Stage 3 completion."""
@@ -1106,35 +1295,67 @@ This final stage produces polished documents ready for distribution."""
             self.output_dir.set(directory)
             self.log_message(f"Output directory set: {directory}")
             
-    def refresh_documents_list(self):
-        """Refresh the generated documents list."""
-        # Clear existing items
-        for item in self.docs_tree.get_children():
-            self.docs_tree.delete(item)
-            
+    def refresh_documents_list(self, force=False):
+        """Refresh the generated documents list.
+        
+        The output directory is rescanned only when its mtime has changed, which covers
+        documents being added, removed or renamed. Pass force=True after rewriting
+        documents in place (Stage 4), since that leaves the directory mtime alone.
+        """
+        self._docs_force_scan = self._docs_force_scan or force
+        # Coalesce rapid refresh requests (button clicks, stage completions) into one scan
+        if self._docs_refresh_job is not None:
+            self.root.after_cancel(self._docs_refresh_job)
+        self._docs_refresh_job = self.root.after(250, self._refresh_documents_list_now)
+        
+    def _refresh_documents_list_now(self):
+        """Scan the output directory and update the documents list if it changed."""
+        self._docs_refresh_job = None
+        force, self._docs_force_scan = self._docs_force_scan, False
         output_path = self.output_dir.get()
-        if not os.path.exists(output_path):
+        rows = []
+        
+        try:
+            dir_mtime = os.stat(output_path).st_mtime_ns
+        except OSError:
+            dir_mtime = None
+        scan_key = (output_path, dir_mtime)
+        if not force and scan_key == self._docs_scan_key:
             return
-            
+        self._docs_scan_key = scan_key
+        
         try:
-            for filename in os.listdir(output_path):
-                if filename.endswith('.docx'):
-                    file_path = os.path.join(output_path, filename)
-                    stat = os.stat(file_path)
-                    
-                    size = f"{stat.st_size / 1024:.1f} KB"
-                    modified = datetime.fromtimestamp(stat.st_mtime).strftime("%Y-%m-%d %H:%M")
-                    
-                    self.docs_tree.insert(
-                        '',
-                        'end',
-                        text=filename,
-                        values=('Generated', size, modified)
-                    )
-                    
+            if dir_mtime is not None:
+                # scandir entries carry the file type, and on Windows the stat data too
+                with os.scandir(output_path) as entries:
+                    for entry in entries:
+                        if entry.name.endswith('.docx'):
+                            stat = entry.stat()
+                            
+                            size = f"{stat.st_size / 1024:.1f} KB"
+                            modified = datetime.fromtimestamp(stat.st_mtime).strftime("%Y-%m-%d %H:%M")
+                            rows.append((entry.name, size, modified))
+                            
         except Exception as e:
+            self._docs_scan_key = None  # rescan next time
             self.log_message(f"Error refreshing documents list: {str(e)}")
             
+        # Leave the tree alone when nothing changed since the last refresh
+        if rows == self._docs_rows:
+            return
+        self._docs_rows = rows
+        
+        # Clear existing items in a single call
+        self.docs_tree.delete(*self.docs_tree.get_children())
+        
+        for filename, size, modified in rows:
+            self.docs_tree.insert(
+                '',
+                'end',
+                text=filename,
+                values=('Generated', size, modified)
+            )
+            
     def open_output_folder(self):
         """Open the output folder in file explorer."""
         output_path = self.output_dir.get()
@@ -1145,40 +1366,60 @@ This final stage produces polished documents ready for distribution."""
             
     def run_stage4(self):
         """Execute Stage 4: Document Generation."""
-        try:
-            self.log_message("Starting Stage 4: Document Generation...")
-            
-            # Ensure output directory exists
-            os.makedirs(self.output_dir.get(), exist_ok=True)
-            
-            # Run generate_documents.py
-            cmd = [sys.executable, "generate_documents.py", "--output", self.output_dir.get()]
-            result = subprocess.run(cmd, capture_output=True, text=True, cwd=self.project_dir)
-            
-            if result.returncode == 0:
-                self.project_state['stage'] = 4
-                if 4 not in self.project_state['stages_completed']:
-                    self.project_state['stages_completed'].append(4)
-                    
-                self.update_progress_display()
-                self.refresh_documents_list()
-                
-                messagebox.showinfo(
-                    "Success", 
-                    "Stage 4: Document Generation completed successfully!\n\n"
-                    f"Documents saved to: {self.output_dir.get()}"
-                )
-                self.log_message("✅ Stage 4 completed successfully!")
+        self.log_message("Starting Stage 4: Document Generation...")
+        
+        # Read the Tk variable here; worker threads must not touch Tk objects
+        output_dir = self.output_dir.get()
+        
+        # Disable UI during processing
+        self.notebook.tab(3, state='disabled')
+        
+        # Run Stage 4 in background thread so the window keeps responding
+        def run_stage4_thread():
+            try:
+                # Ensure output directory exists
+                os.makedirs(output_dir, exist_ok=True)
                 
-                # Open output folder automatically
-                self.open_output_folder()
+                # Run generate_documents.py
+                cmd = [sys.executable, "generate_documents.py", "--output", output_dir]
+                result = subprocess.run(cmd, capture_output=True, text=True, cwd=self.project_dir)
                 
-            else:
-                raise Exception(result.stderr or "Document generation failed")
+                if result.returncode == 0:
+                    self.root.after(0, self.on_stage4_complete)
+                else:
+                    self.root.after(0, lambda msg=result.stderr or "Document generation failed":
+                                    self.on_stage4_error(msg))
+                    
+            except Exception as e:
+                self.root.after(0, lambda msg=str(e): self.on_stage4_error(msg))
                 
-        except Exception as e:
-            messagebox.showerror("Error", f"Stage 4 failed: {str(e)}")
-            self.log_message(f"❌ Stage 4 failed: {str(e)}")
+        threading.Thread(target=run_stage4_thread, daemon=True).start()
+        
+    def on_stage4_complete(self):
+        """Handle Stage 4 completion."""
+        self.project_state['stage'] = 4
+        if 4 not in self.project_state['stages_completed']:
+            self.project_state['stages_completed'].append(4)
+            
+        self.update_progress_display()
+        self.refresh_documents_list(force=True)
+        self.notebook.tab(3, state='normal')
+        
+        messagebox.showinfo(
+            "Success", 
+            "Stage 4: Document Generation completed successfully!\n\n"
+            f"Documents saved to: {self.output_dir.get()}"
+        )
+        self.log_message("✅ Stage 4 completed successfully!")
+        
+        # Open output folder automatically
+        self.open_output_folder()
+        
+    def on_stage4_error(self, error_msg):
+        """Handle Stage 4 error."""
+        self.notebook.tab(3, state='normal')
+        messagebox.showerror("Error", f"Stage 4 failed: {error_msg}")
+        self.log_message(f"❌ Stage 4 failed: {error_msg}")
 
 
 def main():
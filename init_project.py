@@ -26,8 +26,9 @@ import shutil
 import argparse
 from datetime import datetime
 from typing import Dict, List, Optional, Tuple
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 from config_manager import get_config_manager
+from lm_client import create_lm_session
 
 
 @dataclass
@@ -43,7 +44,16 @@ class SectionInfo:
     needs_revision: bool = False
 
     def to_dict(self):
-        return asdict(self)
+        return {
+            'number': self.number,
+            'title': self.title,
+            'description': self.description,
+            'content': self.content,
+            'status': self.status,
+            'word_count': self.word_count,
+            'review_notes': self.review_notes,
+            'needs_revision': self.needs_revision
+        }
     
     @classmethod
     def from_dict(cls, data):
@@ -73,11 +83,12 @@ class LMStudioClient:
         self.base_url = base_url.rstrip('/')
         self.model_name = model_name
         self.api_url = f"{self.base_url}/v1/chat/completions"
+        self.session = create_lm_session()
         
     def test_connection(self) -> bool:
         """Test if the connection to LM Studio is working"""
         try:
-            response = requests.get(f"{self.base_url}/v1/models", timeout=10)
+            response = self.session.get(f"{self.base_url}/v1/models", timeout=10)
             return response.status_code == 200
         except requests.RequestException as e:
             print(f"Connection test failed: {e}")
@@ -109,7 +120,7 @@ class LMStudioClient:
         }
         
         try:
-            response = requests.post(self.api_url, json=payload, timeout=120)
+            response = self.session.post(self.api_url, json=payload, timeout=120)
             response.raise_for_status()
             
             result = response.json()
@@ -180,6 +191,8 @@ class ProjectInitializer:
         sections_data = [section.to_dict() for section in sections]
         with open(self.sections_file, 'w', encoding='utf-8') as f:
             json.dump(sections_data, f, indent=2, ensure_ascii=False)
+        # Per-section files left by an interrupted Stage 3 run describe the old section list
+        shutil.rmtree(os.path.join(self.project_dir, "sections"), ignore_errors=True)
     
     def save_variables(self, variables: Dict, manual_description: str):
         """Save variables to YAML configuration (now deprecated - ConfigManager handles this)"""
@@ -697,11 +710,12 @@ def batch_initialize_projects():
     
     print("✅ Successfully connected to LM Studio!")
     
-    # Save common configuration
-    config = {
+    # Save common configuration, keeping other settings (e.g. max_concurrency) already in it
+    config = dict(existing_config)
+    config.update({
         'lm_studio_url': lm_studio_url,
         'model_name': model_name,
-    }
+    })
     config_file = os.path.join(os.getcwd(), "config.json")
     with open(config_file, 'w', encoding='utf-8') as f:
         json.dump(config, f, indent=2)
@@ -875,14 +889,15 @@ def gui_batch_mode(organogram_path: str, manual_types: List[str]):
         
         print("✅ Successfully connected to LM Studio!")
         
-        # Common configuration
-        config = {
+        # Common configuration, keeping other settings (e.g. max_concurrency) already in it
+        config = dict(existing_config)
+        config.update({
             'lm_studio_url': lm_studio_url,
             'model_name': model_name,
             'company_name': company_name,
             'organogram_path': organogram_path,
             'timestamp': datetime.now().isoformat()
-        }
+        })
         
         # Process each selected manual
         processed_manuals = []
@@ -0,0 +1,28 @@
+#!/usr/bin/env python3
+"""
+LM Studio HTTP session setup shared by Stage 1 (init_project.py) and
+Stage 3 (generate_content.py).
+"""
+
+
+def create_lm_session(pool_size: int = 8):
+    """Create the keep-alive requests session shared by the LM Studio clients
+
+    pool_size should be at least the number of requests made at once; urllib3 closes
+    connections returned to a full pool, and the next request has to reconnect.
+    """
+    # requests is imported here rather than at module level so the project menu starts
+    # without loading it; later imports in the methods are just sys.modules lookups
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    # Retries busy/unavailable responses with backoff. 500 is left out: the completion
+    # may already have run, and POST is not idempotent
+    retry = Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 502, 503, 504],
+                  allowed_methods=frozenset(['GET', 'POST']))
+    adapter = HTTPAdapter(pool_connections=8, pool_maxsize=max(1, pool_size), max_retries=retry)
+    session = requests.Session()
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
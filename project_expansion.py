@@ -18,9 +18,10 @@ Stage 4: Document Generation (generate_documents.py)
 
 import json
 import os
+import shutil
 from datetime import datetime
 from typing import Dict, List, Optional
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 
 
 @dataclass
@@ -36,7 +37,16 @@ class SectionInfo:
     needs_revision: bool = False
 
     def to_dict(self):
-        return asdict(self)
+        return {
+            'number': self.number,
+            'title': self.title,
+            'description': self.description,
+            'content': self.content,
+            'status': self.status,
+            'word_count': self.word_count,
+            'review_notes': self.review_notes,
+            'needs_revision': self.needs_revision
+        }
     
     @classmethod
     def from_dict(cls, data):
@@ -91,6 +101,8 @@ class ProjectExpander:
         sections_data = [section.to_dict() for section in self.sections]
         with open(self.sections_file, 'w', encoding='utf-8') as f:
             json.dump(sections_data, f, indent=2, ensure_ascii=False)
+        # Per-section files left by an interrupted Stage 3 run would overwrite these edits
+        shutil.rmtree(os.path.join(self.project_dir, "sections"), ignore_errors=True)
     
     def save_status(self, updates: Dict):
         """Update and save project status"""
@@ -360,7 +372,7 @@ def list_available_projects(stage_filter: Optional[int] = None) -> List[str]:
                 # Check stage if filter is specified
                 if stage_filter is not None:
                     try:
-                        with open(status_file, 'r') as f:
+                        with open(status_file, 'r', encoding='utf-8') as f:
                             status = json.load(f)
                             project_stage = status.get('stage', 0)
                             if project_stage != stage_filter:
@@ -383,7 +395,7 @@ def select_project() -> Optional[str]:
         for i, project in enumerate(stage_1_projects, 1):
             project_dir = f"{project}_project"
             try:
-                with open(os.path.join(project_dir, 'status.json'), 'r') as f:
+                with open(os.path.join(project_dir, 'status.json'), 'r', encoding='utf-8') as f:
                     status = json.load(f)
                     description = status.get('manual_description', 'No description')
                     stage_name = status.get('stage_name', 'unknown')
@@ -418,7 +430,7 @@ def select_project() -> Optional[str]:
     for i, project in enumerate(all_projects, 1):
         project_dir = f"{project}_project"
         try:
-            with open(os.path.join(project_dir, 'status.json'), 'r') as f:
+            with open(os.path.join(project_dir, 'status.json'), 'r', encoding='utf-8') as f:
                 status = json.load(f)
                 description = status.get('manual_description', 'No description')
                 stage = status.get('stage', 'Unknown')